@@ -1,10 +1,22 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, Menu
 import threading
+import queue
+import time
+import functools
+import itertools
+import logging
+import weakref
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from operator import itemgetter
 from typing import Dict
 import os
 import re
 import sys
+import io
+import csv
+import gzip
 import json
 import subprocess
 from datetime import datetime
@@ -12,9 +24,190 @@ from version_checker import VersionChecker
 from browser_backup import BrowserBackup
 from hardware_info import HardwareInfoManager
 from startup_manager import StartupManager
+import windows_services
+
+try:
+    import orjson  # Optional: faster JSON encoding for large exports
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: streaming parse of imported version files
+    _JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
+log = logging.getLogger(__name__)
+
 
 class VersionCheckerGUI:
     """GUI interface for the Version Checker application."""
+
+    SERVICES_CACHE_TTL = 5.0  # Seconds a service enumeration stays valid
+    DEPENDENCY_CACHE_TTL = 30.0  # Seconds a dependency lookup stays valid
+    SERVICES_BATCH_SIZE = 50  # Services inserted into the tree per Tk tick
+    SERVICE_DESCRIPTION_PREVIEW = 100  # Description characters shown in the tree
+    STATUS_CACHE_TTL = 30.0  # Seconds a Windows Update / Hyper-V status is shown without re-checking first
+    PROGRESS_UPDATE_MS = 50  # Milliseconds between progress updates posted from worker threads
+
+    # Version results that mean the tool was not found on this machine
+    _MISSING_VERSIONS = frozenset(['Not installed', 'Not found', 'Timeout (5s)', 'Error'])
+    # Backup file versions that mean the tool was not installed when the backup was taken
+    _BACKUP_MISSING_VERSIONS = _MISSING_VERSIONS | {
+        "'java' is not recognized as an internal or external command,",
+        "'vue' is not recognized as an internal or external command,",
+        "'svn' is not recognized as an internal or external command,",
+    }
+
+    # Confirmation shown before installing a tool
+    _INSTALL_PROMPT_TEMPLATE = (
+        "Do you want to install {tool_name}{version_text}?\n\n"
+        "Description: {description}\n\n"
+        "This will use available package managers (winget, chocolatey, or npm) "
+        "and may require administrator privileges.\n\n"
+        "Continue with installation?"
+    )
+
+    # Actions offered for a tool in the version results tree
+    ACTION_INSTALL, ACTION_UNINSTALL, ACTION_MANUAL = 0, 1, 2
+    # Action code -> (action column text, row tags)
+    _ACTION_DISPLAY = {
+        ACTION_INSTALL: ("📦 Install", ('installable',)),
+        ACTION_UNINSTALL: ("✅ Installed | 🗑️ Uninstall", ('installed', 'uninstall')),
+        ACTION_MANUAL: ("⚠️ Manual", ('not_installed',)),
+    }
+
+    # Icon shown before each version results category
+    _CATEGORY_ICONS = {
+        "Languages": "🔤",
+        "Package Managers": "📦",
+        "Frontend Tools": "🖥️",
+        "Version Control": "🔄",
+        "Databases": "💾",
+        "Development Tools": "🔧",
+        "Development Environments": "🏗️",
+        "Cloud Tools": "☁️"
+    }
+
+    # Display order of service categories
+    SERVICE_CATEGORY_PRIORITY = {
+        'Critical': 0, 'Essential': 1, 'Security': 2,
+        'Windows Update': 3, 'Standard': 4, 'Third-party': 5
+    }
+
+    # Treeview tag (row color) for each service category
+    SERVICE_CATEGORY_TAGS = {
+        'Critical': ('critical',),
+        'Essential': ('essential',),
+        'Security': ('security',),
+        'Windows Update': ('update',),
+        'Third-party': ('third_party',)
+    }
+
+    # One "sc query" record: SERVICE_NAME line, optional DISPLAY_NAME line and
+    # the STATE value further down, without running into the next record
+    _SC_SERVICE_RE = re.compile(
+        r'^[ \t]*SERVICE_NAME:[ \t]*(.+?)[ \t]*\n'
+        r'(?:[ \t]*DISPLAY_NAME:[ \t]*(.*?)[ \t]*\n)?'
+        r'(?:(?:(?![ \t]*SERVICE_NAME:).*\n)*?[ \t]*STATE[ \t]*:[ \t]*\d+[ \t]+(\S+))?',
+        re.MULTILINE
+    )
+
+    # sc state names mapped to display text ('' when a record has no STATE line)
+    _SC_STATE_NAMES = {
+        '': 'Unknown',
+        'RUNNING': 'Running',
+        'STOPPED': 'Stopped',
+        'START_PENDING': 'Start Pending',
+        'STOP_PENDING': 'Stop Pending',
+        'PAUSED': 'Paused',
+        'PAUSE_PENDING': 'Pause Pending',
+        'CONTINUE_PENDING': 'Continue Pending'
+    }
+
+    # STATE / START_TYPE values from "sc query" and "sc qc" output for one service
+    _SC_STATE_RE = re.compile(r'STATE\s*:\s*\d+\s+(\S+)')
+    _SC_START_TYPE_RE = re.compile(r'START_TYPE\s*:\s*\d+\s+(\S+)')
+
+    _SC_START_TYPE_NAMES = {
+        'AUTO_START': 'Automatic',
+        'DEMAND_START': 'Manual',
+        'DISABLED': 'Disabled'
+    }
+
+    # "State : Enabled" line from "dism /get-featureinfo"
+    _DISM_STATE_RE = re.compile(r'^\s*State\s*:\s*(\S+)\s*$', re.MULTILINE)
+
+    # One service block of the text services report
+    _SERVICE_REPORT_TEMPLATE = (
+        "Service Name: {name}\n"
+        "Display Name: {display_name}\n"
+        "Status: {status}\n"
+        "Startup Type: {start_type}\n"
+    )
+
+    # Common services shown when no enumeration method works
+    _MINIMAL_SERVICES = tuple(
+        {
+            'name': name,
+            'display_name': display_name,
+            'status': 'Unknown',
+            'start_type': 'Unknown',
+            'description': 'Common Windows Service',
+            'path_name': 'Unknown',
+            'service_type': 'Unknown',
+            'process_id': 0
+        }
+        for name, display_name in [
+            ('wuauserv', 'Windows Update'),
+            ('spooler', 'Print Spooler'),
+            ('eventlog', 'Windows Event Log'),
+            ('windefend', 'Windows Defender Antivirus Service'),
+            ('bits', 'Background Intelligent Transfer Service'),
+            ('cryptsvc', 'Cryptographic Services'),
+            ('dhcp', 'DHCP Client'),
+            ('dnscache', 'DNS Client'),
+            ('rpcss', 'Remote Procedure Call (RPC)'),
+            ('schedule', 'Task Scheduler')
+        ]
+    )
+
+    # Service name keywords used by _categorize_service, compiled once into
+    # a single alternation per category (matched against lowercased names)
+
+    # Critical system services
+    _CRITICAL_SERVICES_RE = re.compile('|'.join(map(re.escape, [
+        'winlogon', 'csrss', 'wininit', 'services', 'lsass', 'svchost',
+        'dwm', 'explorer', 'audiodg', 'conhost', 'smss'
+    ])))
+
+    # Windows essential services
+    _ESSENTIAL_SERVICES_RE = re.compile('|'.join(map(re.escape, [
+        'eventlog', 'rpcss', 'dcomlaunch', 'plugplay', 'power', 'profiler',
+        'schedule', 'seclogon', 'sens', 'sharedaccess', 'shellhwdetection',
+        'spooler', 'srservice', 'stisvc', 'themes', 'winmgmt', 'wuauserv',
+        'bits', 'cryptsvc', 'dhcp', 'dnscache', 'lanmanserver',
+        'lanmanworkstation', 'netlogon', 'nla', 'policyagent', 'samss',
+        'termservice', 'w32time', 'workstation'
+    ])))
+
+    # Windows Update related
+    _UPDATE_SERVICES_RE = re.compile('|'.join(map(re.escape, [
+        'wuauserv', 'bits', 'cryptsvc', 'trustedinstaller'
+    ])))
+
+    # Security services
+    _SECURITY_SERVICES_RE = re.compile('|'.join(map(re.escape, [
+        'windefend', 'wscsvc', 'securityhealthservice', 'sense',
+        'mpssvc', 'bfe', 'keyiso', 'vaultsvc'
+    ])))
+
+    # Third-party indicators
+    _THIRD_PARTY_SERVICES_RE = re.compile('|'.join(map(re.escape, [
+        'adobe', 'google', 'microsoft office', 'steam', 'nvidia', 'intel',
+        'realtek', 'vmware', 'virtualbox', 'teamviewer', 'skype', 'zoom'
+    ])))
     
     def __init__(self):
         self.root = tk.Tk()
@@ -40,6 +233,26 @@ class VersionCheckerGUI:
         self.startup_manager = StartupManager()
         self.results = {}
         self.installing_tools = set()  # Track tools currently being installed
+        self._installing_lock = threading.Lock()  # Guards installing_tools across worker threads
+        self._pending_children = {}  # collapsed category item -> tool rows not yet inserted
+        self._row_meta = {}  # tool item -> (tool_name, action code)
+        self._pending_status = {}  # Tcl variable name -> (StringVar, latest progress message not yet shown)
+        self._status_lock = threading.Lock()
+        self._check_timeout_id = None  # after() id of the pending version check timeout
+        self._backup_cache = None  # ((mtime_ns, size), tools to install) from the last backup.json read
+        self._dialogs = {}  # Pooled Toplevel dialogs, reused across opens
+        self._services_cache = None  # Last service enumeration result
+        self._services_cache_ts = 0.0
+        self._is_admin = None  # Memoized check_admin_privileges() result
+        self._dependency_cache = {}  # service name -> (dependents, timestamp)
+        self._scm_handle = None  # Service Control Manager handle, opened on first use
+        self._scm_finalizer = None
+        self._wu_status_cache = None  # (timestamp, (status, start_type)) of the last Windows Update check
+        self._hyperv_status_cache = None  # (timestamp, state) of the last Hyper-V check
+        # Bumped by toggles and cache invalidations so a late background check can be dropped
+        self._wu_check_generation = 0
+        self._hyperv_check_generation = 0
+        self._hyperv_buttons = ()  # (enable, disable) buttons of the Hyper-V dialog
         
         # Modern color scheme with dark/light theme support
         self.theme_mode = "light"  # Can be "light" or "dark"
@@ -147,6 +360,29 @@ class VersionCheckerGUI:
 
         return dialog
 
+    def _get_pooled_dialog(self, key):
+        """Return the pooled dialog for key if it is still alive, else None."""
+        dialog = self._dialogs.get(key)
+        if dialog is not None and dialog.winfo_exists():
+            return dialog
+        return None
+
+    def _register_pooled_dialog(self, key, dialog):
+        """Keep dialog alive after close so the next open can reuse its widgets."""
+        self._dialogs[key] = dialog
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_pooled_dialog(dialog))
+
+    def _show_pooled_dialog(self, dialog):
+        """Bring a hidden pooled dialog back on screen."""
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+
+    def _hide_pooled_dialog(self, dialog):
+        """Hide a pooled dialog instead of destroying it."""
+        dialog.grab_release()
+        dialog.withdraw()
+
     def create_modern_header(self, parent, title, icon="", subtitle=""):
         """Create a clean header with minimal styling."""
         header_frame = ttk.Frame(parent, padding="10")
@@ -1079,8 +1315,7 @@ class VersionCheckerGUI:
             cb = ttk.Checkbutton(
                 frame,
                 text=option_descriptions[option],
-                variable=var,
-                style="TCheckbutton"
+                variable=var
             )
             cb.pack(side=tk.LEFT)
         
@@ -1728,8 +1963,7 @@ class VersionCheckerGUI:
         auto_refresh_cb = ttk.Checkbutton(
             button_frame,
             text="🔄 Auto-refresh (5s)",
-            variable=auto_refresh_var,
-            style="TCheckbutton"
+            variable=auto_refresh_var
         )
         auto_refresh_cb.pack(side=tk.RIGHT)
 
@@ -1813,8 +2047,7 @@ class VersionCheckerGUI:
 
     def get_current_time(self):
         """Get current time as formatted string."""
-        import datetime
-        return datetime.datetime.now().strftime("%H:%M:%S")
+        return datetime.now().strftime("%H:%M:%S")
 
     def test_internet_speed(self, progress_callback=None):
         """Test internet speed using multiple methods."""
@@ -2159,10 +2392,6 @@ class VersionCheckerGUI:
 
     def save_speed_test_result(self, result):
         """Save speed test result to history file."""
-        import json
-        import datetime
-        import os
-
         try:
             history_file = "speed_test_history.json"
 
@@ -2176,8 +2405,8 @@ class VersionCheckerGUI:
                     history = []
 
             # Add new result with timestamp
-            result['timestamp'] = datetime.datetime.now().isoformat()
-            result['date'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            result['timestamp'] = datetime.now().isoformat()
+            result['date'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             history.append(result)
 
             # Keep only last 50 results
@@ -2192,9 +2421,6 @@ class VersionCheckerGUI:
 
     def load_speed_test_history(self):
         """Load speed test history from file."""
-        import json
-        import os
-
         try:
             history_file = "speed_test_history.json"
             if os.path.exists(history_file):
@@ -2207,6 +2433,19 @@ class VersionCheckerGUI:
 
     def show_speed_test(self):
         """Show Internet Speed Test dialog."""
+        # Reuse the pooled dialog if it was opened before
+        dialog = self._get_pooled_dialog('speed_test')
+        if dialog is not None:
+            if str(self.start_test_btn['state']) != 'disabled':
+                # No test running - reset results from the previous session
+                self.speed_download_label.config(text="Download Speed: Not tested")
+                self.speed_upload_label.config(text="Upload Speed: Not tested")
+                self.speed_ping_label.config(text="Ping: Not tested")
+                self.speed_status_label.config(text="Ready to test")
+                self.speed_progress['value'] = 0
+            self._show_pooled_dialog(dialog)
+            return
+
         # Create dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Internet Speed Test")
@@ -2294,13 +2533,14 @@ class VersionCheckerGUI:
         close_btn = ttk.Button(
             main_frame,
             text="Close",
-            command=dialog.destroy,
+            command=lambda: self._hide_pooled_dialog(dialog),
             style="Secondary.TButton"
         )
         close_btn.pack(pady=(10, 0))
 
         # Store dialog reference
         self.speed_test_dialog = dialog
+        self._register_pooled_dialog('speed_test', dialog)
 
     def start_speed_test(self, dialog):
         """Start the speed test in a background thread."""
@@ -2370,6 +2610,13 @@ class VersionCheckerGUI:
 
     def show_speed_history(self, parent_dialog):
         """Show speed test history dialog."""
+        # Reuse the pooled dialog and just reload its rows
+        history_dialog = self._get_pooled_dialog('speed_history')
+        if history_dialog is not None:
+            self._populate_speed_history()
+            self._show_pooled_dialog(history_dialog)
+            return
+
         # Create history dialog
         history_dialog = tk.Toplevel(parent_dialog)
         history_dialog.title("Speed Test History")
@@ -2415,29 +2662,12 @@ class VersionCheckerGUI:
         history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Load and display history
-        history = self.load_speed_test_history()
-
-        if history:
-            # Sort by timestamp (newest first)
-            history.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-
-            for entry in history:
-                if entry.get('status') == 'Completed':
-                    history_tree.insert("", tk.END, values=(
-                        entry.get('date', 'Unknown'),
-                        f"{entry.get('download_speed', 0):.1f}",
-                        f"{entry.get('upload_speed', 0):.1f}",
-                        f"{entry.get('ping', 0)}"
-                    ))
-        else:
-            # Show message if no history
-            no_data_label = ttk.Label(
-                main_frame,
-                text="No speed test history available. Run a test to see results here.",
-                style="Info.TLabel"
-            )
-            no_data_label.pack(pady=20)
+        # Message shown when there is no history (packed on demand)
+        no_data_label = ttk.Label(
+            main_frame,
+            text="No speed test history available. Run a test to see results here.",
+            style="Info.TLabel"
+        )
 
         # Buttons frame
         button_frame = ttk.Frame(main_frame)
@@ -2456,36 +2686,70 @@ class VersionCheckerGUI:
         close_btn = ttk.Button(
             button_frame,
             text="Close",
-            command=history_dialog.destroy,
+            command=lambda: self._hide_pooled_dialog(history_dialog),
             style="Secondary.TButton"
         )
         close_btn.pack(side=tk.RIGHT)
 
+        self.speed_history_tree = history_tree
+        self.speed_history_empty_label = no_data_label
+        self.speed_history_button_frame = button_frame
+        self._register_pooled_dialog('speed_history', history_dialog)
+
+        # Load and display history
+        self._populate_speed_history()
+
+    def _populate_speed_history(self):
+        """(Re)load the speed test history into the pooled history dialog."""
+        history_tree = self.speed_history_tree
+        children = history_tree.get_children()
+        if children:
+            history_tree.delete(*children)
+
+        history = self.load_speed_test_history()
+
+        if history:
+            self.speed_history_empty_label.pack_forget()
+
+            # Sort by timestamp (newest first)
+            history.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+
+            # Build all row tuples up front, then insert them in one pass
+            rows = [
+                (
+                    entry.get('date', 'Unknown'),
+                    f"{entry.get('download_speed', 0):.1f}",
+                    f"{entry.get('upload_speed', 0):.1f}",
+                    str(entry.get('ping', 0))
+                )
+                for entry in history if entry.get('status') == 'Completed'
+            ]
+            for row in rows:
+                history_tree.insert("", tk.END, values=row)
+        else:
+            # Show message if no history
+            self.speed_history_empty_label.pack(pady=20, before=self.speed_history_button_frame)
+
     def clear_speed_history(self, dialog):
         """Clear speed test history."""
-        import os
-
         if messagebox.askyesno("Clear History", "Are you sure you want to clear all speed test history?"):
             try:
                 history_file = "speed_test_history.json"
                 if os.path.exists(history_file):
                     os.remove(history_file)
                 messagebox.showinfo("Success", "Speed test history cleared successfully!")
-                dialog.destroy()
+                self._hide_pooled_dialog(dialog)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to clear history: {str(e)}")
 
     def get_network_connections(self):
         """Get current network connections and processes."""
-        import subprocess
-        import json
-
         try:
             # PowerShell command to get network connections with process information
             ps_command = [
                 "powershell",
                 "-Command",
-                "Get-NetTCPConnection | Where-Object {$_.State -eq 'Established' -or $_.State -eq 'Listen'} | ForEach-Object { $proc = Get-Process -Id $_.OwningProcess -ErrorAction SilentlyContinue; [PSCustomObject]@{ LocalAddress = $_.LocalAddress; LocalPort = $_.LocalPort; RemoteAddress = $_.RemoteAddress; RemotePort = $_.RemotePort; State = $_.State; ProcessId = $_.OwningProcess; ProcessName = if($proc) {$proc.ProcessName} else {'Unknown'}; ProcessPath = if($proc) {$proc.Path} else {'Unknown'} } } | ConvertTo-Json"
+                "Get-NetTCPConnection | Where-Object {$_.State -eq 'Established' -or $_.State -eq 'Listen'} | ForEach-Object { $proc = Get-Process -Id $_.OwningProcess -ErrorAction SilentlyContinue; [PSCustomObject]@{ LocalAddress = $_.LocalAddress; LocalPort = $_.LocalPort; RemoteAddress = $_.RemoteAddress; RemotePort = $_.RemotePort; State = $_.State; ProcessId = $_.OwningProcess; ProcessName = if($proc) {$proc.ProcessName} else {'Unknown'}; ProcessPath = if($proc) {$proc.Path} else {'Unknown'} } } | ConvertTo-Csv -NoTypeInformation"
             ]
 
             result = subprocess.run(
@@ -2498,35 +2762,39 @@ class VersionCheckerGUI:
 
             if result.returncode == 0 and result.stdout.strip():
                 try:
-                    # Parse JSON output
-                    connections_data = json.loads(result.stdout)
-
-                    # Handle single connection (not in array)
-                    if isinstance(connections_data, dict):
-                        connections_data = [connections_data]
+                    # Parse CSV output - every row has the same columns, so
+                    # there is no single-object vs array special case
+                    reader = csv.reader(io.StringIO(result.stdout))
+                    header = next(reader)
 
                     # Process and clean the data
                     connections = []
-                    for conn in connections_data:
+                    for row in reader:
+                        conn = dict(zip(header, row))
+
                         # Skip localhost connections to reduce noise
                         if conn.get('RemoteAddress') in ['127.0.0.1', '::1', '0.0.0.0']:
                             continue
 
+                        local_port = conn.get('LocalPort', '')
+                        remote_port = conn.get('RemotePort', '')
+                        process_id = conn.get('ProcessId', '')
+
                         connections.append({
                             'local_address': conn.get('LocalAddress', ''),
-                            'local_port': conn.get('LocalPort', 0),
+                            'local_port': int(local_port) if local_port.isdigit() else 0,
                             'remote_address': conn.get('RemoteAddress', ''),
-                            'remote_port': conn.get('RemotePort', 0),
+                            'remote_port': int(remote_port) if remote_port.isdigit() else 0,
                             'state': conn.get('State', ''),
-                            'process_id': conn.get('ProcessId', 0),
-                            'process_name': conn.get('ProcessName', 'Unknown'),
-                            'process_path': conn.get('ProcessPath', 'Unknown')
+                            'process_id': int(process_id) if process_id.isdigit() else 0,
+                            'process_name': conn.get('ProcessName') or 'Unknown',
+                            'process_path': conn.get('ProcessPath') or 'Unknown'
                         })
 
                     return connections
 
-                except json.JSONDecodeError as e:
-                    print(f"JSON decode error: {e}")
+                except (csv.Error, StopIteration) as e:
+                    print(f"CSV parse error: {e}")
                     return []
             else:
                 print(f"PowerShell command failed: {result.stderr}")
@@ -2538,8 +2806,6 @@ class VersionCheckerGUI:
 
     def kill_process_by_id(self, process_id):
         """Kill a process by its ID."""
-        import subprocess
-
         try:
             # Use taskkill to terminate the process
             result = subprocess.run(
@@ -2558,14 +2824,21 @@ class VersionCheckerGUI:
         except Exception as e:
             return False, f"Error terminating process: {str(e)}"
 
-    def export_network_connections(self, connections, format_type='json', filepath=None):
-        """Export network connections to file with file dialog."""
-        import json
-        import datetime
-        import os
+    def export_network_connections(self, connections, format_type='json', filepath=None, total=None):
+        """Export network connections to file with file dialog.
 
+        Args:
+            connections: Iterable of connection dicts; consumed in one pass
+            format_type: 'json' or 'text'
+            filepath: Destination path, asked for with a file dialog if omitted
+            total: Number of connections, if known without materializing them
+        """
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            if total is None:
+                connections = list(connections)
+                total = len(connections)
+
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
             # If no filepath provided, show file dialog
             if not filepath:
@@ -2595,55 +2868,80 @@ class VersionCheckerGUI:
                     print(f"File dialog error, using default filename: {dialog_error}")
 
             if format_type == 'json':
-                export_data = {
-                    'export_info': {
-                        'timestamp': datetime.datetime.now().isoformat(),
-                        'date_readable': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'total_connections': len(connections),
-                        'format_version': '1.0'
-                    },
-                    'connections': connections
+                export_info = {
+                    'timestamp': datetime.now().isoformat(),
+                    'date_readable': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'total_connections': total,
+                    'format_version': '1.0'
                 }
+                encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
 
+                # Stream one connection at a time; the layout matches
+                # json.dump(..., indent=2) of the full export_data dict
                 with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                    f.write('{\n  "export_info": ')
+                    f.write(encoder.encode(export_info).replace('\n', '\n  '))
+                    f.write(',\n  "connections": [')
+                    separator = '\n    '
+                    for conn in connections:
+                        f.write(separator)
+                        f.write(encoder.encode(conn).replace('\n', '\n    '))
+                        separator = ',\n    '
+                    f.write(']\n}' if separator == '\n    ' else '\n  ]\n}')
 
             else:  # text format
+                # Group connections by process, counting states and picking out
+                # external connections in the same single pass
+                processes = {}
+                states = {}
+                external_connections = []
+                for conn in connections:
+                    proc_name = conn.get('process_name', 'Unknown')
+                    if proc_name not in processes:
+                        processes[proc_name] = []
+                    processes[proc_name].append(conn)
+
+                    state = conn.get('state', 'Unknown')
+                    states[state] = states.get(state, 0) + 1
+
+                    remote_address = conn.get('remote_address', '')
+                    if (remote_address and
+                            not remote_address.startswith('127.') and
+                            not remote_address.startswith('192.168.') and
+                            not remote_address.startswith('10.') and
+                            remote_address != '0.0.0.0'):
+                        external_connections.append(conn)
+
                 with open(filepath, 'w', encoding='utf-8') as f:
                     # Header
                     f.write("=" * 80 + "\n")
                     f.write("NETWORK CONNECTIONS REPORT\n")
                     f.write("=" * 80 + "\n")
-                    f.write(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"Total Connections: {len(connections)}\n")
+                    f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    f.write(f"Total Connections: {total}\n")
                     f.write("=" * 80 + "\n\n")
 
-                    if not connections:
+                    if not processes:
                         f.write("No network connections found.\n")
                     else:
-                        # Group connections by process for better readability
-                        processes = {}
-                        for conn in connections:
-                            proc_name = conn.get('process_name', 'Unknown')
-                            if proc_name not in processes:
-                                processes[proc_name] = []
-                            processes[proc_name].append(conn)
-
                         # Write grouped connections
                         for proc_name, proc_connections in sorted(processes.items()):
                             f.write(f"PROCESS: {proc_name}\n")
                             f.write("-" * 60 + "\n")
 
-                            for i, conn in enumerate(proc_connections, 1):
-                                f.write(f"  Connection #{i}:\n")
-                                f.write(f"    Process ID: {conn.get('process_id', 'Unknown')}\n")
-                                f.write(f"    Local Address: {conn.get('local_address', 'Unknown')}\n")
-                                f.write(f"    Local Port: {conn.get('local_port', 'Unknown')}\n")
-                                f.write(f"    Remote Address: {conn.get('remote_address', 'N/A')}\n")
-                                f.write(f"    Remote Port: {conn.get('remote_port', 'N/A')}\n")
-                                f.write(f"    Connection State: {conn.get('state', 'Unknown')}\n")
-                                f.write(f"    Process Path: {conn.get('process_path', 'Unknown')}\n")
-                                f.write("\n")
+                            # One formatted block per connection instead of a write per field
+                            f.writelines(
+                                f"  Connection #{i}:\n"
+                                f"    Process ID: {conn.get('process_id', 'Unknown')}\n"
+                                f"    Local Address: {conn.get('local_address', 'Unknown')}\n"
+                                f"    Local Port: {conn.get('local_port', 'Unknown')}\n"
+                                f"    Remote Address: {conn.get('remote_address', 'N/A')}\n"
+                                f"    Remote Port: {conn.get('remote_port', 'N/A')}\n"
+                                f"    Connection State: {conn.get('state', 'Unknown')}\n"
+                                f"    Process Path: {conn.get('process_path', 'Unknown')}\n"
+                                "\n"
+                                for i, conn in enumerate(proc_connections, 1)
+                            )
 
                             f.write("\n")
 
@@ -2652,28 +2950,12 @@ class VersionCheckerGUI:
                         f.write("SUMMARY\n")
                         f.write("=" * 80 + "\n")
                         f.write(f"Total Processes: {len(processes)}\n")
-                        f.write(f"Total Connections: {len(connections)}\n")
-
-                        # Count by state
-                        states = {}
-                        for conn in connections:
-                            state = conn.get('state', 'Unknown')
-                            states[state] = states.get(state, 0) + 1
+                        f.write(f"Total Connections: {total}\n")
 
                         f.write("\nConnections by State:\n")
                         for state, count in sorted(states.items()):
                             f.write(f"  {state}: {count}\n")
 
-                        # External connections
-                        external_connections = [
-                            conn for conn in connections
-                            if conn.get('remote_address') and
-                            not conn.get('remote_address', '').startswith('127.') and
-                            not conn.get('remote_address', '').startswith('192.168.') and
-                            not conn.get('remote_address', '').startswith('10.') and
-                            conn.get('remote_address') != '0.0.0.0'
-                        ]
-
                         f.write(f"\nExternal Connections: {len(external_connections)}\n")
                         if external_connections:
                             f.write("External Connection Details:\n")
@@ -2692,6 +2974,18 @@ class VersionCheckerGUI:
 
     def show_network_monitor(self):
         """Show Network Connection Monitor dialog."""
+        # Reuse the pooled dialog and just reload its connections
+        dialog = self._get_pooled_dialog('network')
+        if dialog is not None:
+            children = self.network_tree.get_children()
+            if children:
+                self.network_tree.delete(*children)
+            self._network_rows = []
+            self.kill_process_btn.config(state='disabled')
+            self._show_pooled_dialog(dialog)
+            self.refresh_network_connections(dialog)
+            return
+
         # Create dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Network Connection Monitor")
@@ -2753,8 +3047,7 @@ class VersionCheckerGUI:
             textvariable=export_var,
             values=["📤 Export", "📄 JSON", "📝 Text"],
             state="readonly",
-            width=12,
-            style="TCombobox"
+            width=12
         )
         export_combo.pack(side=tk.RIGHT, padx=(10, 0))
 
@@ -2822,13 +3115,15 @@ class VersionCheckerGUI:
         close_btn = ttk.Button(
             main_frame,
             text="Close",
-            command=dialog.destroy,
+            command=lambda: self._hide_pooled_dialog(dialog),
             style="Secondary.TButton"
         )
         close_btn.pack(pady=(10, 0))
 
         # Store dialog reference
         self.network_dialog = dialog
+        self._register_pooled_dialog('network', dialog)
+        self._network_rows = []  # Connections currently shown in the tree
 
         # Auto-refresh on open
         self.refresh_network_connections(dialog)
@@ -2841,6 +3136,7 @@ class VersionCheckerGUI:
         # Clear existing items
         for item in self.network_tree.get_children():
             self.network_tree.delete(item)
+        self._network_rows = []
 
         # Get connections in background thread
         threading.Thread(target=self.load_network_connections_thread, args=(dialog,), daemon=True).start()
@@ -2862,10 +3158,12 @@ class VersionCheckerGUI:
             # Clear existing items
             for item in self.network_tree.get_children():
                 self.network_tree.delete(item)
+            self._network_rows = []
 
             if connections:
                 # Sort connections by process name
                 connections.sort(key=lambda x: x['process_name'].lower())
+                self._network_rows = connections
 
                 # Add connections to tree
                 for conn in connections:
@@ -2941,64 +3239,16 @@ class VersionCheckerGUI:
     def export_network_data(self, dialog, format_type):
         """Export network connections data with file dialog."""
         try:
-            # Get current connections
-            connections = []
-            for item in self.network_tree.get_children():
-                values = self.network_tree.item(item, 'values')
-
-                if len(values) < 6:
-                    continue  # Skip incomplete entries
-
-                # Parse local and remote addresses safely
-                try:
-                    local_parts = str(values[2]).split(':')
-                    remote_parts = str(values[3]).split(':') if str(values[3]) != 'N/A' else ['', '']
-
-                    # Handle cases where address might be empty or malformed
-                    local_address = local_parts[0] if len(local_parts) > 0 else ''
-                    local_port = 0
-                    if len(local_parts) > 1:
-                        try:
-                            local_port = int(local_parts[1])
-                        except (ValueError, IndexError):
-                            local_port = 0
-
-                    remote_address = remote_parts[0] if len(remote_parts) > 0 and remote_parts[0] else ''
-                    remote_port = 0
-                    if len(remote_parts) > 1 and remote_parts[1]:
-                        try:
-                            remote_port = int(remote_parts[1])
-                        except (ValueError, IndexError):
-                            remote_port = 0
-
-                    # Parse process ID safely
-                    process_id = 0
-                    try:
-                        process_id = int(str(values[1])) if str(values[1]).isdigit() else 0
-                    except (ValueError, IndexError):
-                        process_id = 0
-
-                    connections.append({
-                        'process_name': str(values[0]) if values[0] else 'Unknown',
-                        'process_id': process_id,
-                        'local_address': local_address,
-                        'local_port': local_port,
-                        'remote_address': remote_address,
-                        'remote_port': remote_port,
-                        'state': str(values[4]) if values[4] else 'Unknown',
-                        'process_path': str(values[5]) if values[5] else 'Unknown'
-                    })
-
-                except Exception as e:
-                    print(f"Error parsing connection data: {e}")
-                    continue
-
+            # Export the snapshot taken when the tree was last populated,
+            # rather than reading every row back out of the Treeview
+            connections = self._network_rows
             if not connections:
                 messagebox.showwarning("No Data", "No network connections to export. Please refresh the data first.")
                 return
 
-            # Call the export function
-            success, message = self.export_network_connections(connections, format_type)
+            success, message = self.export_network_connections(
+                connections, format_type, total=len(connections)
+            )
 
             if success:
                 messagebox.showinfo("Export Successful", message)
@@ -3010,83 +3260,103 @@ class VersionCheckerGUI:
             messagebox.showerror("Export Error", f"Failed to export network data: {str(e)}")
 
     def get_windows_services(self):
-        """Get all Windows services with detailed information."""
-        import subprocess
+        """Get all Windows services, reusing a recent enumeration if available."""
+        if (self._services_cache is not None and
+                time.monotonic() - self._services_cache_ts < self.SERVICES_CACHE_TTL):
+            return self._services_cache
+
+        services = self._enumerate_windows_services()
+        self._services_cache = services
+        self._services_cache_ts = time.monotonic()
+        return services
 
+    def _get_scm_handle(self):
+        """Open the Service Control Manager once and reuse the handle for the session."""
+        if self._scm_handle is None:
+            self._scm_handle = windows_services.open_scm()
+            # Released on app exit, or when the GUI object is collected
+            self._scm_finalizer = weakref.finalize(self, windows_services.close_handle, self._scm_handle)
+        return self._scm_handle
+
+    def _close_scm_handle(self):
+        """Release the shared Service Control Manager handle, if open."""
+        if self._scm_finalizer is not None:
+            self._scm_finalizer()
+            self._scm_finalizer = None
+        self._scm_handle = None
+
+    def _invalidate_services_cache(self):
+        """Drop the cached service list so the next load re-enumerates."""
+        self._services_cache = None
+        self._services_cache_ts = 0.0
+
+    def _enumerate_windows_services(self):
+        """Get all Windows services with detailed information."""
         try:
-            print("Attempting to get Windows services...")
+            log.debug("Attempting to get Windows services...")
+
+            # Enumerate through the native SCM API first - no child process
+            try:
+                services = windows_services.enum_services(self._get_scm_handle())
+                if services:
+                    for service in services:
+                        service.update({
+                            'start_type': 'Unknown',
+                            'description': 'Windows Service',
+                            'path_name': 'Unknown',
+                            'category': self._categorize_service(service['name'])
+                        })
+                    log.debug("Successfully loaded %d services using the SCM API", len(services))
+                    return services
+            except OSError as e:
+                log.warning("SCM enumeration failed, trying sc command: %s", e)
 
-            # Use sc command directly - more reliable than PowerShell
+            # Use sc command as fallback - more reliable than PowerShell
             result = subprocess.run(
                 ['sc', 'query', 'type=', 'service', 'state=', 'all'],
                 capture_output=True,
                 text=True,
                 timeout=30,
-                shell=True
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
             )
 
             if result.returncode == 0:
                 services = self._parse_sc_output(result.stdout)
                 if services:
-                    print(f"Successfully loaded {len(services)} services using sc command")
+                    log.debug("Successfully loaded %d services using sc command", len(services))
                     return services
 
             # Fallback to PowerShell if sc fails
-            print("sc command failed, trying PowerShell...")
+            log.warning("sc command failed, trying PowerShell...")
             return self._get_services_powershell()
 
         except Exception as e:
-            print(f"Error getting Windows services: {e}")
+            log.error("Error getting Windows services: %s", e)
             return self._get_services_minimal()
 
     def _parse_sc_output(self, output):
         """Parse sc query output to extract service information."""
         try:
-            services = []
-            lines = output.split('\n')
-            current_service = {}
-
-            for line in lines:
-                line = line.strip()
-
-                if line.startswith('SERVICE_NAME:'):
-                    # Save previous service if exists
-                    if current_service and current_service.get('name'):
-                        services.append(current_service)
-
-                    # Start new service
-                    service_name = line.split(':', 1)[1].strip()
-                    current_service = {
-                        'name': service_name,
-                        'display_name': service_name,
-                        'status': 'Unknown',
-                        'start_type': 'Unknown',
-                        'description': 'Windows Service',
-                        'path_name': 'Unknown',
-                        'service_type': 'Unknown',
-                        'process_id': 0,
-                        'category': self._categorize_service(service_name)
-                    }
-
-                elif line.startswith('DISPLAY_NAME:') and current_service:
-                    display_name = line.split(':', 1)[1].strip()
-                    current_service['display_name'] = display_name
-
-                elif line.startswith('STATE') and current_service:
-                    # Parse state line: "STATE              : 4  RUNNING"
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        status = parts[3].replace('_', ' ').title()
-                        current_service['status'] = status
-
-            # Add last service
-            if current_service and current_service.get('name'):
-                services.append(current_service)
-
-            return services
+            # One regex scan over the whole buffer yields (name, display name, state),
+            # each match emitted directly as a complete service dict
+            return [
+                {
+                    'name': service_name,
+                    'display_name': display_name or service_name,
+                    # State line looks like "STATE              : 4  RUNNING"
+                    'status': self._SC_STATE_NAMES.get(state) or state.replace('_', ' ').title(),
+                    'start_type': 'Unknown',
+                    'description': 'Windows Service',
+                    'path_name': 'Unknown',
+                    'service_type': 'Unknown',
+                    'process_id': 0,
+                    'category': self._categorize_service(service_name)
+                }
+                for service_name, display_name, state in self._SC_SERVICE_RE.findall(output)
+            ]
 
         except Exception as e:
-            print(f"Error parsing sc output: {e}")
+            log.error("Error parsing sc output: %s", e)
             return []
 
     def _get_services_powershell(self):
@@ -3105,7 +3375,7 @@ class VersionCheckerGUI:
                 capture_output=True,
                 text=True,
                 timeout=30,
-                shell=True
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
             )
 
             if result.returncode == 0 and result.stdout.strip():
@@ -3134,105 +3404,61 @@ class VersionCheckerGUI:
                             }
                             services.append(service_info)
 
-                print(f"PowerShell fallback loaded {len(services)} services")
+                log.debug("PowerShell fallback loaded %d services", len(services))
                 return services
             else:
-                print(f"PowerShell fallback failed: {result.stderr}")
+                log.warning("PowerShell fallback failed: %s", result.stderr)
                 return self._get_services_minimal()
 
         except Exception as e:
-            print(f"PowerShell fallback error: {e}")
+            log.error("PowerShell fallback error: %s", e)
             return self._get_services_minimal()
 
     def _get_services_minimal(self):
         """Minimal fallback - return some common services."""
-        print("Using minimal service list fallback")
-
-        common_services = [
-            ('wuauserv', 'Windows Update', 'Unknown'),
-            ('spooler', 'Print Spooler', 'Unknown'),
-            ('eventlog', 'Windows Event Log', 'Unknown'),
-            ('windefend', 'Windows Defender Antivirus Service', 'Unknown'),
-            ('bits', 'Background Intelligent Transfer Service', 'Unknown'),
-            ('cryptsvc', 'Cryptographic Services', 'Unknown'),
-            ('dhcp', 'DHCP Client', 'Unknown'),
-            ('dnscache', 'DNS Client', 'Unknown'),
-            ('rpcss', 'Remote Procedure Call (RPC)', 'Unknown'),
-            ('schedule', 'Task Scheduler', 'Unknown')
-        ]
-
-        services = []
-        for name, display_name, status in common_services:
-            service_info = {
-                'name': name,
-                'display_name': display_name,
-                'status': status,
-                'start_type': 'Unknown',
-                'description': 'Common Windows Service',
-                'path_name': 'Unknown',
-                'service_type': 'Unknown',
-                'process_id': 0,
-                'category': self._categorize_service(name)
-            }
-            services.append(service_info)
-
-        return services
-
-    def _categorize_service(self, service_name):
-        """Categorize services based on their importance and type."""
-        service_name_lower = service_name.lower()
-
-        # Critical system services
-        critical_services = [
-            'winlogon', 'csrss', 'wininit', 'services', 'lsass', 'svchost',
-            'dwm', 'explorer', 'audiodg', 'conhost', 'winlogon', 'smss'
-        ]
+        log.warning("Using minimal service list fallback")
 
-        # Windows essential services
-        essential_services = [
-            'eventlog', 'rpcss', 'dcomlaunch', 'plugplay', 'power', 'profiler',
-            'schedule', 'seclogon', 'sens', 'sharedaccess', 'shellhwdetection',
-            'spooler', 'srservice', 'stisvc', 'themes', 'winmgmt', 'wuauserv',
-            'bits', 'cryptsvc', 'dhcp', 'dnscache', 'eventlog', 'lanmanserver',
-            'lanmanworkstation', 'netlogon', 'nla', 'policyagent', 'samss',
-            'termservice', 'w32time', 'workstation'
+        # Callers annotate the service dicts, so hand out copies of the constant
+        return [
+            dict(service, category=self._categorize_service(service['name']))
+            for service in self._MINIMAL_SERVICES
         ]
 
-        # Windows Update related
-        update_services = ['wuauserv', 'bits', 'cryptsvc', 'trustedinstaller']
+    @classmethod
+    @functools.lru_cache(maxsize=2048)
+    def _categorize_service(cls, service_name):
+        """Categorize services based on their importance and type.
 
-        # Security services
-        security_services = [
-            'windefend', 'wscsvc', 'securityhealthservice', 'sense',
-            'mpssvc', 'bfe', 'keyiso', 'vaultSvc'
-        ]
-
-        # Third-party indicators
-        third_party_indicators = [
-            'adobe', 'google', 'microsoft office', 'steam', 'nvidia', 'intel',
-            'realtek', 'vmware', 'virtualbox', 'teamviewer', 'skype', 'zoom'
-        ]
+        Results are memoized per service name, since the same names come
+        back on every refresh.
+        """
+        service_name_lower = service_name.lower()
 
-        if any(critical in service_name_lower for critical in critical_services):
+        if cls._CRITICAL_SERVICES_RE.search(service_name_lower):
             return 'Critical'
-        elif any(essential in service_name_lower for essential in essential_services):
+        elif cls._ESSENTIAL_SERVICES_RE.search(service_name_lower):
             return 'Essential'
-        elif any(update in service_name_lower for update in update_services):
+        elif cls._UPDATE_SERVICES_RE.search(service_name_lower):
             return 'Windows Update'
-        elif any(security in service_name_lower for security in security_services):
+        elif cls._SECURITY_SERVICES_RE.search(service_name_lower):
             return 'Security'
-        elif any(third_party in service_name_lower for third_party in third_party_indicators):
+        elif cls._THIRD_PARTY_SERVICES_RE.search(service_name_lower):
             return 'Third-party'
         else:
             return 'Standard'
 
     def check_admin_privileges(self):
-        """Check if the application is running with administrator privileges."""
-        import ctypes
-        try:
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except:
-            return False
+        """Check if the application is running with administrator privileges.
+
+        The answer cannot change without a restart, so it is looked up once.
+        """
+        if self._is_admin is None:
+            import ctypes
+            try:
+                self._is_admin = bool(ctypes.windll.shell32.IsUserAnAdmin())
+            except:
+                self._is_admin = False
+        return self._is_admin
 
     def restart_as_admin(self):
         """Restart the application with administrator privileges."""
@@ -3268,45 +3494,52 @@ class VersionCheckerGUI:
 
     def control_service(self, service_name, action):
         """Control a Windows service (start/stop/restart)."""
-        import subprocess
-
         try:
             if not self.check_admin_privileges():
                 return False, "Administrator privileges required for service control"
 
+            # Talk to the Service Control Manager directly instead of spawning sc.exe
+            scm_handle = self._get_scm_handle()
             if action == 'start':
-                cmd = ['sc', 'start', service_name]
+                windows_services.start_service(service_name, scm_handle)
             elif action == 'stop':
-                cmd = ['sc', 'stop', service_name]
+                windows_services.stop_service(service_name, scm_handle)
             elif action == 'restart':
-                # Stop first, then start
-                stop_result = subprocess.run(['sc', 'stop', service_name],
-                                           capture_output=True, text=True, timeout=30)
-                if stop_result.returncode != 0 and "service is not started" not in stop_result.stderr.lower():
-                    return False, f"Failed to stop service: {stop_result.stderr}"
-
-                # Wait a moment before starting
-                import time
-                time.sleep(2)
-                cmd = ['sc', 'start', service_name]
+                # Polls for the stopped state instead of a fixed sleep
+                windows_services.restart_service(service_name, scm_handle, timeout=30)
             else:
                 return False, f"Invalid action: {action}"
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0:
-                return True, f"Service {action} command executed successfully"
-            else:
-                return False, f"Service {action} failed: {result.stderr}"
+            self._invalidate_services_cache()
+            self._dependency_cache.pop(service_name, None)
+            return True, f"Service {action} command executed successfully"
 
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             return False, f"Service {action} operation timed out"
+        except OSError as e:
+            return False, f"Service {action} failed: {e.strerror or e}"
         except Exception as e:
             return False, f"Error controlling service: {str(e)}"
 
     def get_service_dependencies(self, service_name):
-        """Get services that depend on the specified service."""
-        import subprocess
+        """Get services that depend on the specified service.
+
+        Results are cached per service for DEPENDENCY_CACHE_TTL seconds.
+        """
+        cached = self._dependency_cache.get(service_name)
+        if cached is not None and time.monotonic() - cached[1] < self.DEPENDENCY_CACHE_TTL:
+            return cached[0]
+
+        dependencies = self._lookup_service_dependencies(service_name)
+        self._dependency_cache[service_name] = (dependencies, time.monotonic())
+        return dependencies
+
+    def _lookup_service_dependencies(self, service_name):
+        """Query the dependents of a service, natively or through PowerShell."""
+        try:
+            return windows_services.enum_dependent_services(service_name, self._get_scm_handle())
+        except OSError as e:
+            log.warning("EnumDependentServices failed for %s, trying PowerShell: %s", service_name, e)
 
         try:
             # Get services that depend on this service
@@ -3321,7 +3554,7 @@ class VersionCheckerGUI:
                 capture_output=True,
                 text=True,
                 timeout=30,
-                shell=True
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
             )
 
             if result.returncode == 0 and result.stdout.strip():
@@ -3343,36 +3576,41 @@ class VersionCheckerGUI:
 
     def toggle_windows_update(self, enable=True):
         """Enable or disable Windows Update service."""
-        import subprocess
-
         try:
             if not self.check_admin_privileges():
                 return False, "Administrator privileges required"
 
             service_name = "wuauserv"
+            scm_handle = self._get_scm_handle()
 
             if enable:
                 # Enable and start Windows Update
-                commands = [
-                    ['sc', 'config', service_name, 'start=', 'auto'],
-                    ['sc', 'start', service_name]
+                steps = [
+                    ("set start type to auto",
+                     lambda: windows_services.set_start_type(
+                         service_name, windows_services.SERVICE_AUTO_START, scm_handle)),
+                    ("start",
+                     lambda: windows_services.start_service(service_name, scm_handle, ignore_running=True))
                 ]
                 action_desc = "enabled"
             else:
                 # Stop and disable Windows Update
-                commands = [
-                    ['sc', 'stop', service_name],
-                    ['sc', 'config', service_name, 'start=', 'disabled']
+                steps = [
+                    ("stop",
+                     lambda: windows_services.stop_service(service_name, scm_handle, ignore_not_active=True)),
+                    ("set start type to disabled",
+                     lambda: windows_services.set_start_type(
+                         service_name, windows_services.SERVICE_DISABLED, scm_handle))
                 ]
                 action_desc = "disabled"
 
-            for cmd in commands:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                if result.returncode != 0:
-                    # Some failures are acceptable (like stopping an already stopped service)
-                    if "service is not started" not in result.stderr.lower():
-                        print(f"Command failed: {' '.join(cmd)} - {result.stderr}")
+            for step_desc, step in steps:
+                try:
+                    step()
+                except OSError as e:
+                    print(f"Failed to {step_desc} {service_name}: {e}")
 
+            self._invalidate_services_cache()
             return True, f"Windows Update has been {action_desc}"
 
         except Exception as e:
@@ -3393,7 +3631,13 @@ class VersionCheckerGUI:
                 cmd = ['dism', '/online', '/disable-feature', '/featurename:Microsoft-Hyper-V-All', '/norestart']
                 action_desc = "disabled"
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=120,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+            )
 
             if result.returncode == 0:
                 return True, f"Hyper-V has been {action_desc}. A system restart is required."
@@ -3461,10 +3705,12 @@ class VersionCheckerGUI:
                                      width=12, state="readonly")
         category_combo.pack(side=tk.LEFT, padx=(0, 15))
 
-        # Bind search and filter events
-        self.service_search_var.trace("w", lambda *args: self.filter_services(dialog))
-        self.service_status_filter.trace("w", lambda *args: self.filter_services(dialog))
-        self.service_category_filter.trace("w", lambda *args: self.filter_services(dialog))
+        # Bind search and filter events (debounced so fast typing filters once)
+        self._filter_after_id = None
+        self._filter_insert_job = None
+        self.service_search_var.trace("w", lambda *args: self._schedule_filter_services(dialog))
+        self.service_status_filter.trace("w", lambda *args: self._schedule_filter_services(dialog))
+        self.service_category_filter.trace("w", lambda *args: self._schedule_filter_services(dialog))
 
         # Control buttons frame
         control_frame = ttk.Frame(main_frame)
@@ -3478,7 +3724,7 @@ class VersionCheckerGUI:
         refresh_btn = ttk.Button(
             left_buttons,
             text="🔄 Refresh Services",
-            command=lambda: self.refresh_services(dialog),
+            command=lambda: self.refresh_services(dialog, force=True),
             style="Primary.TButton"
         )
         refresh_btn.pack(side=tk.LEFT, padx=(0, 10))
@@ -3511,6 +3757,9 @@ class VersionCheckerGUI:
         )
         self.restart_service_btn.pack(side=tk.LEFT, padx=(0, 10))
 
+        # Buttons that follow the tree selection together
+        self._service_control_buttons = (self.start_service_btn, self.stop_service_btn, self.restart_service_btn)
+
         # Right side buttons
         right_buttons = ttk.Frame(control_frame)
         right_buttons.pack(side=tk.RIGHT)
@@ -3537,10 +3786,9 @@ class VersionCheckerGUI:
         service_export_combo = ttk.Combobox(
             right_buttons,
             textvariable=service_export_var,
-            values=["📤 Export", "📄 JSON", "📝 Text"],
+            values=["📤 Export", "📄 JSON", "🗜️ JSON (gzip)", "📃 JSON Lines", "📝 Text"],
             state="readonly",
-            width=12,
-            style="TCombobox"
+            width=12
         )
         service_export_combo.pack(side=tk.RIGHT, padx=(10, 0))
 
@@ -3549,6 +3797,12 @@ class VersionCheckerGUI:
             if selection == "📄 JSON":
                 self.export_services_dialog(dialog, 'json')
                 service_export_var.set("📤 Export")
+            elif selection == "🗜️ JSON (gzip)":
+                self.export_services_dialog(dialog, 'json_gz')
+                service_export_var.set("📤 Export")
+            elif selection == "📃 JSON Lines":
+                self.export_services_dialog(dialog, 'jsonl')
+                service_export_var.set("📤 Export")
             elif selection == "📝 Text":
                 self.export_services_dialog(dialog, 'text')
                 service_export_var.set("📤 Export")
@@ -3579,6 +3833,9 @@ class VersionCheckerGUI:
         self.services_tree.column("category", width=100)
         self.services_tree.column("description", width=300)
 
+        # Row colors per category
+        self._configure_services_tree_tags()
+
         # Add scrollbars
         v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.services_tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.services_tree.xview)
@@ -3593,8 +3850,9 @@ class VersionCheckerGUI:
         tree_frame.rowconfigure(0, weight=1)
         tree_frame.columnconfigure(0, weight=1)
 
-        # Bind selection event
-        self.services_tree.bind('<<TreeviewSelect>>', lambda e: self.on_service_selection(dialog))
+        # Bind selection event (debounced so arrowing through rows updates once)
+        self._selection_after_id = None
+        self.services_tree.bind('<<TreeviewSelect>>', lambda e: self._schedule_service_selection(dialog))
 
         # Status and info frame
         info_frame = ttk.Frame(main_frame)
@@ -3610,7 +3868,6 @@ class VersionCheckerGUI:
 
         # Admin status label
         admin_status = "Administrator" if self.check_admin_privileges() else "Standard User"
-        admin_color = "green" if self.check_admin_privileges() else "red"
         self.admin_status_label = ttk.Label(
             info_frame,
             text=f"Running as: {admin_status}",
@@ -3630,134 +3887,242 @@ class VersionCheckerGUI:
         # Store dialog reference
         self.service_dialog = dialog
         self.all_services = []  # Store all services for filtering
+        self._services_by_category = defaultdict(list)
+        self._services_by_status = defaultdict(list)
+        self._service_search_blob = None
+        self._service_search_offsets = []
+        self._services_load_id = 0
 
         # Auto-refresh on open
         self.refresh_services(dialog)
 
-    def refresh_services(self, dialog):
-        """Refresh the services display."""
-        self.service_status_label.config(text="Loading Windows services...")
-        dialog.update()
+    def refresh_services(self, dialog, force=False):
+        """Refresh the services display.
 
-        # Clear existing items
-        for item in self.services_tree.get_children():
-            self.services_tree.delete(item)
+        Args:
+            dialog: The service manager dialog
+            force: Re-enumerate even if a recent cached service list exists
+                and drop cached dependency lookups
+        """
+        if force:
+            self._invalidate_services_cache()
+            self._dependency_cache.clear()
 
-        # Get services in background thread
-        threading.Thread(target=self.load_services_thread, args=(dialog,), daemon=True).start()
+        self.service_status_label.config(text="Loading Windows services...")
+        dialog.update_idletasks()
 
-    def load_services_thread(self, dialog):
-        """Load services in background thread."""
+        # Clear existing items in a single Tcl call
+        self._cancel_filter_inserts()
+        children = self.services_tree.get_children()
+        if children:
+            self.services_tree.delete(*children)
+        self.all_services = []
+        self._services_by_category = defaultdict(list)
+        self._services_by_status = defaultdict(list)
+        self._service_search_blob = None
+        self._service_search_offsets = []
+
+        # Enumerate in a background thread and stream the rows back in batches;
+        # the load id lets a newer refresh supersede one still in flight
+        self._services_load_id += 1
+        services_queue = queue.Queue()
+        threading.Thread(target=self.load_services_thread, args=(services_queue,), daemon=True).start()
+        dialog.after(10, self._drain_services_queue, dialog, services_queue, self._services_load_id)
+
+    def load_services_thread(self, services_queue):
+        """Load services in background thread and queue them in display order."""
         try:
-            print("Starting to load Windows services...")
+            log.debug("Starting to load Windows services...")
             services = self.get_windows_services()
-            print(f"Loaded {len(services)} services from get_windows_services()")
+            log.debug("Loaded %d services from get_windows_services()", len(services))
 
-            # Update UI in main thread
-            dialog.after(0, lambda: self.update_services_display(dialog, services))
+            # Precompute per-service search keys here rather than per keystroke
+            for service in services:
+                self._prepare_service(service)
+
+            # Sort services by category priority, then by name, so batches
+            # can be appended to the tree as they arrive
+            services = sorted(services, key=itemgetter('_sort_key'))
+
+            for start in range(0, len(services), self.SERVICES_BATCH_SIZE):
+                services_queue.put(services[start:start + self.SERVICES_BATCH_SIZE])
+            services_queue.put(None)
 
         except Exception as e:
             error_msg = f"Error loading services: {str(e)}"
-            print(error_msg)
-            dialog.after(0, lambda: self.service_status_label.config(text=error_msg))
+            log.error(error_msg)
+            services_queue.put(e)
+
+    def _prepare_service(self, service):
+        """Attach the lookup keys and tree row used when filtering a service."""
+        service['_name_lc'] = service['name'].lower()
+        service['_display_lc'] = service['display_name'].lower()
+        service['_sort_key'] = (self.SERVICE_CATEGORY_PRIORITY.get(service['category'], 6), service['_name_lc'])
+
+        # Row values and tags are fixed for the lifetime of the load, so the
+        # description is truncated here once rather than on every render
+        description = service['description']
+        preview_length = self.SERVICE_DESCRIPTION_PREVIEW
+        service['_tags'] = self.SERVICE_CATEGORY_TAGS.get(service['category'], ())
+        service['_row'] = (
+            service['name'],
+            service['display_name'],
+            service['status'],
+            service['start_type'],
+            service['category'],
+            description[:preview_length] + "..." if len(description) > preview_length else description
+        )
+
+    def _drain_services_queue(self, dialog, services_queue, load_id):
+        """Insert one queued batch of services per tick on the Tk thread."""
+        if load_id != self._services_load_id or not dialog.winfo_exists():
+            return
+
+        try:
+            batch = services_queue.get_nowait()
+        except queue.Empty:
+            dialog.after(10, self._drain_services_queue, dialog, services_queue, load_id)
+            return
+
+        if batch is None:
+            self._finish_services_load()
+        elif isinstance(batch, Exception):
+            self.service_status_label.config(text=f"Error loading services: {str(batch)}")
+        else:
+            self.update_services_display(dialog, batch)
+            dialog.after(10, self._drain_services_queue, dialog, services_queue, load_id)
 
     def update_services_display(self, dialog, services):
-        """Update the services display."""
+        """Add a batch of loaded services to the display."""
         try:
-            print(f"Updating services display with {len(services)} services")
-
-            # Store all services for filtering
-            self.all_services = services
-
-            if not services:
-                self.service_status_label.config(text="No services found. This might indicate a PowerShell execution issue.")
-                # Show a helpful message in the tree
-                self.services_tree.insert("", tk.END, values=(
-                    "No services found",
-                    "PowerShell might be restricted or services unavailable",
-                    "Unknown",
-                    "Unknown",
-                    "Error",
-                    "Try running as Administrator or check PowerShell execution policy"
-                ))
-                return
+            log.debug("Updating services display with %d services", len(services))
 
-            # Apply current filters
-            self.filter_services(dialog)
+            # Store all services for filtering, plus category/status indexes so
+            # a filtered view only has to scan the matching services
+            self.all_services.extend(services)
+            for service in services:
+                self._services_by_category[service['category']].append(service)
+                self._services_by_status[service['status']].append(service)
 
-            self.service_status_label.config(text=f"Loaded {len(services)} Windows services")
+            # Only rows matching the current filters go into the tree
+            self._insert_service_rows(self._filter_service_list(services))
+
+            self.service_status_label.config(text=f"Loading Windows services... ({len(self.all_services)} loaded)")
 
         except Exception as e:
             error_msg = f"Error updating display: {str(e)}"
-            print(error_msg)
+            log.error(error_msg)
             self.service_status_label.config(text=error_msg)
 
+    def _finish_services_load(self):
+        """Update the status once every service batch has been displayed."""
+        if not self.all_services:
+            self.service_status_label.config(text="No services found. This might indicate a PowerShell execution issue.")
+            # Show a helpful message in the tree
+            self.services_tree.insert("", tk.END, values=(
+                "No services found",
+                "PowerShell might be restricted or services unavailable",
+                "Unknown",
+                "Unknown",
+                "Error",
+                "Try running as Administrator or check PowerShell execution policy"
+            ))
+            return
+
+        self._build_service_search_index()
+        self.service_status_label.config(text=f"Loaded {len(self.all_services)} Windows services")
+
+    def _build_service_search_index(self):
+        """Join every lowercased name and display name into one searchable blob.
+
+        Each service contributes one segment holding its name and display name
+        on separate lines; the segment start offsets map a str.find() hit back
+        to its service with bisect.
+        """
+        parts = []
+        offsets = []
+        position = 0
+        for service in self.all_services:
+            segment = f"{service['_name_lc']}\n{service['_display_lc']}\n"
+            offsets.append(position)
+            parts.append(segment)
+            position += len(segment)
+        self._service_search_blob = ''.join(parts)
+        self._service_search_offsets = offsets
+
+    def _search_service_names(self, search_text):
+        """Return the names of all loaded services whose name or display name contains search_text."""
+        blob = self._service_search_blob
+        offsets = self._service_search_offsets
+        matches = set()
+        start = blob.find(search_text)
+        while start >= 0:
+            index = bisect_right(offsets, start) - 1
+            matches.add(self.all_services[index]['name'])
+            # One hit is enough for a service; resume at the next segment
+            if index + 1 >= len(offsets):
+                break
+            start = blob.find(search_text, offsets[index + 1])
+        return matches
+
+    def _schedule_filter_services(self, dialog):
+        """Run filter_services once input has been idle for 150 ms."""
+        if self._filter_after_id is not None:
+            dialog.after_cancel(self._filter_after_id)
+        self._filter_after_id = dialog.after(150, self._run_scheduled_filter, dialog)
+
+    def _run_scheduled_filter(self, dialog):
+        """Debounce callback for _schedule_filter_services."""
+        self._filter_after_id = None
+        # The dialog may have been closed while the filter was pending
+        if dialog.winfo_exists():
+            self.filter_services(dialog)
+
     def filter_services(self, dialog):
-        """Filter services based on search and filter criteria."""
+        """Filter services based on search and filter criteria.
+
+        Only the difference between the rows on screen and the new result is
+        sent to Tk: rows that no longer match are deleted in one call and
+        newly matching rows are inserted at their sorted position.
+        """
         try:
-            # Clear existing items
-            for item in self.services_tree.get_children():
-                self.services_tree.delete(item)
+            # A newer filter supersedes rows still queued by the previous one
+            self._cancel_filter_inserts()
+            children = self.services_tree.get_children()
 
             if not hasattr(self, 'all_services') or not self.all_services:
+                if children:
+                    self.services_tree.delete(*children)
                 return
 
-            # Get filter criteria
-            search_text = self.service_search_var.get().lower()
-            status_filter = self.service_status_filter.get()
+            # Start from the smallest candidate set the indexes can give us
             category_filter = self.service_category_filter.get()
-
-            # Filter services
-            filtered_services = []
-            for service in self.all_services:
-                # Apply search filter
-                if search_text and search_text not in service['name'].lower() and search_text not in service['display_name'].lower():
-                    continue
-
-                # Apply status filter
-                if status_filter != "All" and service['status'] != status_filter:
-                    continue
-
-                # Apply category filter
-                if category_filter != "All" and service['category'] != category_filter:
-                    continue
-
-                filtered_services.append(service)
+            status_filter = self.service_status_filter.get()
+            if category_filter != "All":
+                candidates = self._services_by_category.get(category_filter, [])
+            elif status_filter != "All":
+                candidates = self._services_by_status.get(status_filter, [])
+            else:
+                candidates = self.all_services
+            filtered_services = self._filter_service_list(candidates)
 
             # Sort services by category priority, then by name
-            category_priority = {'Critical': 0, 'Essential': 1, 'Security': 2, 'Windows Update': 3, 'Standard': 4, 'Third-party': 5}
-            filtered_services.sort(key=lambda x: (category_priority.get(x['category'], 6), x['name'].lower()))
-
-            # Add filtered services to tree
-            for service in filtered_services:
-                # Determine row color based on category
-                tags = ()
-                if service['category'] == 'Critical':
-                    tags = ('critical',)
-                elif service['category'] == 'Essential':
-                    tags = ('essential',)
-                elif service['category'] == 'Security':
-                    tags = ('security',)
-                elif service['category'] == 'Windows Update':
-                    tags = ('update',)
-                elif service['category'] == 'Third-party':
-                    tags = ('third_party',)
-
-                self.services_tree.insert("", tk.END, values=(
-                    service['name'],
-                    service['display_name'],
-                    service['status'],
-                    service['start_type'],
-                    service['category'],
-                    service['description'][:100] + "..." if len(service['description']) > 100 else service['description']
-                ), tags=tags)
-
-            # Configure tags for color coding - use app background
-            self.services_tree.tag_configure('critical', background=self.colors["background"], foreground='#dc3545')
-            self.services_tree.tag_configure('essential', background=self.colors["background"], foreground='#ffc107')
-            self.services_tree.tag_configure('security', background=self.colors["background"], foreground='#28a745')
-            self.services_tree.tag_configure('update', background=self.colors["background"], foreground='#007bff')
-            self.services_tree.tag_configure('third_party', background=self.colors["background"], foreground='#6c757d')
+            filtered_services.sort(key=itemgetter('_sort_key'))
+
+            # Rows are keyed by service name; drop the ones filtered out
+            desired = {service['name'] for service in filtered_services}
+            to_delete = [iid for iid in children if iid not in desired]
+            if to_delete:
+                self.services_tree.delete(*to_delete)
+
+            # Surviving rows are already in sorted order relative to each other,
+            # so new rows only need inserting at their index - no moves needed
+            remaining = set(children).difference(to_delete)
+            pending = [
+                (index, service) for index, service in enumerate(filtered_services)
+                if service['name'] not in remaining
+            ]
+            self._insert_filtered_rows(pending)
 
             # Update status
             if hasattr(self, 'service_status_label'):
@@ -3767,19 +4132,100 @@ class VersionCheckerGUI:
             if hasattr(self, 'service_status_label'):
                 self.service_status_label.config(text=f"Error filtering services: {str(e)}")
 
+    def _insert_filtered_rows(self, pending, start=0):
+        """Insert (index, service) pairs one batch per idle pass.
+
+        Rows go in ascending index order, so every earlier row is already in
+        place when a later one is inserted, even across batches.
+        """
+        self._filter_insert_job = None
+        if not self.services_tree.winfo_exists():
+            return
+
+        end = start + self.SERVICES_BATCH_SIZE
+        for index, service in pending[start:end]:
+            self._insert_service_row(service, index)
+
+        if end < len(pending):
+            self._filter_insert_job = self.services_tree.after_idle(self._insert_filtered_rows, pending, end)
+
+    def _cancel_filter_inserts(self):
+        """Drop any filter rows still waiting to be inserted."""
+        if self._filter_insert_job is not None:
+            self.services_tree.after_cancel(self._filter_insert_job)
+            self._filter_insert_job = None
+
+    def _filter_service_list(self, services):
+        """Return the services matching the current search and filter criteria."""
+        # Get filter criteria
+        search_text = self.service_search_var.get().lower()
+        status_filter = self.service_status_filter.get()
+        category_filter = self.service_category_filter.get()
+        match_all_status = status_filter == "All"
+        match_all_category = category_filter == "All"
+
+        # Long queries scan the prebuilt name blob once instead of every row;
+        # short ones match too broadly for that to pay off
+        if (len(search_text) >= 3 and self._service_search_blob is not None
+                and len(self._service_search_offsets) == len(self.all_services)):
+            matching_names = self._search_service_names(search_text)
+            return [
+                service for service in services
+                if service['name'] in matching_names
+                and (match_all_status or service['status'] == status_filter)
+                and (match_all_category or service['category'] == category_filter)
+            ]
+
+        return [
+            service for service in services
+            if (match_all_status or service['status'] == status_filter)
+            and (match_all_category or service['category'] == category_filter)
+            and (not search_text
+                 or search_text in service['_name_lc']
+                 or search_text in service['_display_lc'])
+        ]
+
+    def _configure_services_tree_tags(self):
+        """Set up the category row colors once when the services tree is built."""
+        # Configure tags for color coding - use app background
+        self.services_tree.tag_configure('critical', background=self.colors["background"], foreground='#dc3545')
+        self.services_tree.tag_configure('essential', background=self.colors["background"], foreground='#ffc107')
+        self.services_tree.tag_configure('security', background=self.colors["background"], foreground='#28a745')
+        self.services_tree.tag_configure('update', background=self.colors["background"], foreground='#007bff')
+        self.services_tree.tag_configure('third_party', background=self.colors["background"], foreground='#6c757d')
+
+    def _insert_service_row(self, service, index=tk.END):
+        """Insert one service into the tree, using its name as the item id."""
+        self.services_tree.insert("", index, iid=service['name'], values=service['_row'], tags=service['_tags'])
+
+    def _insert_service_rows(self, services):
+        """Append services to the tree with their category colors."""
+        # Hide the columns during the bulk insert so Tk skips per-row layout
+        self.services_tree.configure(displaycolumns=())
+        try:
+            for service in services:
+                self._insert_service_row(service)
+        finally:
+            self.services_tree.configure(displaycolumns="#all")
+
+    def _schedule_service_selection(self, dialog):
+        """Run on_service_selection once the selection has settled for 50 ms."""
+        if self._selection_after_id is not None:
+            dialog.after_cancel(self._selection_after_id)
+        self._selection_after_id = dialog.after(50, self._run_scheduled_selection, dialog)
+
+    def _run_scheduled_selection(self, dialog):
+        """Debounce callback for _schedule_service_selection."""
+        self._selection_after_id = None
+        if dialog.winfo_exists():
+            self.on_service_selection(dialog)
+
     def on_service_selection(self, dialog):
         """Handle service selection."""
-        selection = self.services_tree.selection()
-        if selection:
-            # Enable service control buttons
-            self.start_service_btn.config(state='normal')
-            self.stop_service_btn.config(state='normal')
-            self.restart_service_btn.config(state='normal')
-        else:
-            # Disable service control buttons
-            self.start_service_btn.config(state='disabled')
-            self.stop_service_btn.config(state='disabled')
-            self.restart_service_btn.config(state='disabled')
+        # Enable service control buttons only while a service is selected
+        new_state = ('!disabled',) if self.services_tree.selection() else ('disabled',)
+        for button in self._service_control_buttons:
+            button.state(new_state)
 
     def start_selected_service(self, dialog):
         """Start the selected service."""
@@ -3841,7 +4287,9 @@ class VersionCheckerGUI:
 
         # Perform the action
         self.service_status_label.config(text=f"{action.capitalize()}ing service '{display_name}'...")
-        dialog.update()
+        # Only redraw the label; update() would also run queued input
+        # callbacks (a second click) before the worker starts
+        dialog.update_idletasks()
 
         # Run in background thread
         threading.Thread(target=self._service_control_thread,
@@ -3863,7 +4311,7 @@ class VersionCheckerGUI:
         if success:
             messagebox.showinfo("Success", f"Service '{display_name}' {action} operation completed successfully.")
             # Refresh the services list
-            self.refresh_services(dialog)
+            self.refresh_services(dialog, force=True)
         else:
             messagebox.showerror("Error", f"Failed to {action} service '{display_name}':\n\n{message}")
             self.service_status_label.config(text="Ready")
@@ -3952,79 +4400,102 @@ class VersionCheckerGUI:
 
     def check_windows_update_simple(self, dialog):
         """Simple Windows Update status check with single button logic."""
-        try:
+        cached = self._wu_status_cache
+        if cached is not None and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+            # Paint the recent result right away and re-check behind it
+            self._check_windows_update_complete(dialog, cached[1], None)
+        else:
             # Disable button while checking
             self.windows_update_action_btn.config(text="🔄 Checking...", state='disabled')
             self.update_status_label.config(text="Checking Windows Update status...")
 
-            # Check Windows Update service status
-            result = subprocess.run(
-                ['sc', 'query', 'wuauserv'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=True
+        # sc.exe can take seconds to answer; keep it off the Tk thread
+        generation = self._wu_check_generation
+        threading.Thread(target=self._check_windows_update_thread, args=(dialog, generation), daemon=True).start()
+
+    def _check_windows_update_thread(self, dialog, generation):
+        """Background thread for the Windows Update status check."""
+        try:
+            windows_update_status = self._query_windows_update_status()
+            if windows_update_status is not None and generation == self._wu_check_generation:
+                self._wu_status_cache = (time.monotonic(), windows_update_status)
+            dialog.after(0, lambda: self._check_windows_update_complete(dialog, windows_update_status, None, generation))
+        except Exception as e:
+            error = str(e)
+            dialog.after(0, lambda: self._check_windows_update_complete(dialog, None, error, generation))
+
+    def _check_windows_update_complete(self, dialog, windows_update_status, error, generation=None):
+        """Show the Windows Update status and set the action button."""
+        if not dialog.winfo_exists():
+            return
+
+        # A toggle started after this check; its own re-check will repaint
+        if generation is not None and generation != self._wu_check_generation:
+            return
+
+        if error is not None:
+            self.update_status_label.config(text=f"Error: {error}")
+            self.windows_update_action_btn.config(text="❓ Error", state='disabled')
+            return
+
+        if windows_update_status is None:
+            self.update_status_label.config(text="Unable to check Windows Update status")
+            self.windows_update_action_btn.config(text="❓ Status Unknown", state='disabled')
+            return
+
+        status, start_type = windows_update_status
+
+        # Update status display
+        self.update_status_label.config(text=f"Status: {status} | Startup: {start_type}")
+
+        # Set button based on current status - SIMPLE LOGIC
+        if start_type == "Disabled" or status == "Stopped":
+            # Windows Update is disabled/stopped -> Show ENABLE button
+            self.windows_update_action_btn.config(
+                text="✅ Enable Windows Update",
+                state='normal'
             )
+            self.current_wu_action = True  # Next action is enable
+        else:
+            # Windows Update is enabled/running -> Show DISABLE button
+            self.windows_update_action_btn.config(
+                text="❌ Disable Windows Update",
+                state='normal'
+            )
+            self.current_wu_action = False  # Next action is disable
 
-            if result.returncode == 0:
-                output = result.stdout
-                status = "Unknown"
+    def _query_windows_update_status(self):
+        """Return (status, start_type) of the wuauserv service, or None if sc query fails."""
+        from concurrent.futures import ThreadPoolExecutor
 
-                # Extract status
-                for line in output.split('\n'):
-                    line = line.strip()
-                    if 'STATE' in line and 'RUNNING' in line:
-                        status = "Running"
-                    elif 'STATE' in line and 'STOPPED' in line:
-                        status = "Stopped"
-
-                # Get startup type
-                config_result = subprocess.run(
-                    ['sc', 'qc', 'wuauserv'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    shell=True
-                )
+        # "sc query" and "sc qc" don't depend on each other, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            query_future = executor.submit(
+                subprocess.run, ['sc', 'query', 'wuauserv'],
+                capture_output=True, text=True, timeout=10,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+            )
+            config_future = executor.submit(
+                subprocess.run, ['sc', 'qc', 'wuauserv'],
+                capture_output=True, text=True, timeout=10,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+            )
+            result = query_future.result()
+            config_result = config_future.result()
 
-                start_type = "Unknown"
-                if config_result.returncode == 0:
-                    for line in config_result.stdout.split('\n'):
-                        line = line.strip()
-                        if 'START_TYPE' in line:
-                            if 'AUTO_START' in line:
-                                start_type = "Automatic"
-                            elif 'DEMAND_START' in line:
-                                start_type = "Manual"
-                            elif 'DISABLED' in line:
-                                start_type = "Disabled"
-
-                # Update status display
-                self.update_status_label.config(text=f"Status: {status} | Startup: {start_type}")
-
-                # Set button based on current status - SIMPLE LOGIC
-                if start_type == "Disabled" or status == "Stopped":
-                    # Windows Update is disabled/stopped -> Show ENABLE button
-                    self.windows_update_action_btn.config(
-                        text="✅ Enable Windows Update",
-                        state='normal'
-                    )
-                    self.current_wu_action = True  # Next action is enable
-                else:
-                    # Windows Update is enabled/running -> Show DISABLE button
-                    self.windows_update_action_btn.config(
-                        text="❌ Disable Windows Update",
-                        state='normal'
-                    )
-                    self.current_wu_action = False  # Next action is disable
+        if result.returncode != 0:
+            return None
 
-            else:
-                self.update_status_label.config(text="Unable to check Windows Update status")
-                self.windows_update_action_btn.config(text="❓ Status Unknown", state='disabled')
+        match = self._SC_STATE_RE.search(result.stdout)
+        status = self._SC_STATE_NAMES.get(match.group(1), "Unknown") if match else "Unknown"
 
-        except Exception as e:
-            self.update_status_label.config(text=f"Error: {str(e)}")
-            self.windows_update_action_btn.config(text="❓ Error", state='disabled')
+        start_type = "Unknown"
+        if config_result.returncode == 0:
+            match = self._SC_START_TYPE_RE.search(config_result.stdout)
+            if match:
+                start_type = self._SC_START_TYPE_NAMES.get(match.group(1), "Unknown")
+
+        return status, start_type
 
 
 
@@ -4054,9 +4525,10 @@ class VersionCheckerGUI:
                 return
 
         # Update UI
+        self._wu_check_generation += 1
         self.windows_update_action_btn.config(text=f"🔄 {action_text.capitalize()}ing...", state='disabled')
         self.update_status_label.config(text=f"{action_text.capitalize()}ing Windows Update...")
-        dialog.update()
+        dialog.update_idletasks()
 
         # Run operation in background
         threading.Thread(target=self._windows_update_simple_thread, args=(dialog, enable), daemon=True).start()
@@ -4077,6 +4549,8 @@ class VersionCheckerGUI:
             messagebox.showerror("Error", message)
 
         # Refresh status to update button
+        self._wu_status_cache = None
+        self._wu_check_generation += 1
         self.check_windows_update_simple(dialog)
 
     def show_hyperv_dialog(self, parent_dialog):
@@ -4185,6 +4659,7 @@ Disabling Hyper-V will:
             style="Action.TButton"
         )
         self.disable_hyperv_btn.pack(side=tk.LEFT, padx=(0, 10), fill=tk.X, expand=True)
+        self._hyperv_buttons = (self.enable_hyperv_btn, self.disable_hyperv_btn)
 
         # Refresh status button
         refresh_hyperv_btn = ttk.Button(
@@ -4195,10 +4670,6 @@ Disabling Hyper-V will:
         )
         refresh_hyperv_btn.pack(fill=tk.X, pady=(0, 10))
 
-        # Ensure buttons are initially visible and enabled (fallback)
-        self.enable_hyperv_btn.config(state='normal', text="✅ Enable Hyper-V")
-        self.disable_hyperv_btn.config(state='normal', text="❌ Disable Hyper-V")
-
         # Modern button frame for close
         button_config = [
             ("❌ Close", hyperv_dialog.destroy, "Secondary.TButton", tk.RIGHT)
@@ -4210,125 +4681,108 @@ Disabling Hyper-V will:
 
     def check_hyperv_status(self, dialog):
         """Check current Hyper-V status and update buttons."""
-        try:
+        cached = self._hyperv_status_cache
+        if cached is not None and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+            # Paint the recent result right away and re-check behind it
+            self._check_hyperv_complete(dialog, cached[1], None)
+        else:
             # Disable buttons while checking
-            if hasattr(self, 'enable_hyperv_btn'):
-                self.enable_hyperv_btn.config(state='disabled')
-            if hasattr(self, 'disable_hyperv_btn'):
-                self.disable_hyperv_btn.config(state='disabled')
+            for button in self._hyperv_buttons:
+                button.config(state='disabled')
 
             # Update status label
             self.hyperv_status_label.config(text="🔄 Checking Hyper-V status...")
 
-            # Check if Hyper-V feature is enabled using DISM (more reliable)
-            result = subprocess.run(
-                ['dism', '/online', '/get-featureinfo', '/featurename:Microsoft-Hyper-V-All'],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                shell=True
-            )
+        # DISM can take up to 30 seconds; keep it off the Tk thread
+        generation = self._hyperv_check_generation
+        threading.Thread(target=self._check_hyperv_thread, args=(dialog, generation), daemon=True).start()
 
-            if result.returncode == 0:
-                output = result.stdout
-                state = "Unknown"
+    def _check_hyperv_thread(self, dialog, generation):
+        """Background thread for the Hyper-V status check."""
+        try:
+            state = self._query_hyperv_state()
+            if state is not None and generation == self._hyperv_check_generation:
+                self._hyperv_status_cache = (time.monotonic(), state)
+            dialog.after(0, lambda: self._check_hyperv_complete(dialog, state, None, generation))
+        except Exception as e:
+            error = str(e)
+            dialog.after(0, lambda: self._check_hyperv_complete(dialog, None, error, generation))
 
-                # Parse DISM output
-                for line in output.split('\n'):
-                    line = line.strip()
-                    if 'State :' in line:
-                        if 'Enabled' in line:
-                            state = "Enabled"
-                        elif 'Disabled' in line:
-                            state = "Disabled"
-                        break
-
-                # Update status display
-                status_text = f"Hyper-V Status: {state}"
-                self.hyperv_status_label.config(text=status_text)
-
-                # Enable/disable buttons based on current status
-                if hasattr(self, 'enable_hyperv_btn') and hasattr(self, 'disable_hyperv_btn'):
-                    if state == "Disabled":
-                        # Hyper-V is disabled - enable "Enable" button, disable "Disable" button
-                        self.enable_hyperv_btn.config(state='normal')
-                        self.disable_hyperv_btn.config(state='disabled')
-                        self.enable_hyperv_btn.config(text="✅ Enable Hyper-V")
-                        self.disable_hyperv_btn.config(text="❌ Disable Hyper-V (Already Disabled)")
-                    elif state == "Enabled":
-                        # Hyper-V is enabled - enable "Disable" button, disable "Enable" button
-                        self.enable_hyperv_btn.config(state='disabled')
-                        self.disable_hyperv_btn.config(state='normal')
-                        self.enable_hyperv_btn.config(text="✅ Enable Hyper-V (Already Enabled)")
-                        self.disable_hyperv_btn.config(text="❌ Disable Hyper-V")
-                    else:
-                        # Status unknown - enable both buttons
-                        self.enable_hyperv_btn.config(state='normal', text="✅ Enable Hyper-V")
-                        self.disable_hyperv_btn.config(state='normal', text="❌ Disable Hyper-V")
+    def _query_hyperv_state(self):
+        """Return the Hyper-V feature state, or None if it could not be read."""
+        # Check if Hyper-V feature is enabled using DISM (more reliable)
+        result = subprocess.run(
+            ['dism', '/online', '/get-featureinfo', '/featurename:Microsoft-Hyper-V-All'],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        )
 
-            else:
-                # Fallback to PowerShell method
-                self._check_hyperv_powershell(dialog)
+        if result.returncode != 0:
+            # Fallback to PowerShell method
+            return self._query_hyperv_state_powershell()
 
-        except Exception as e:
-            error_msg = f"Error checking status: {str(e)}"
-            self.hyperv_status_label.config(text=error_msg)
-            # Enable both buttons if error occurred
-            if hasattr(self, 'enable_hyperv_btn') and hasattr(self, 'disable_hyperv_btn'):
-                self.enable_hyperv_btn.config(state='normal', text="✅ Enable Hyper-V")
-                self.disable_hyperv_btn.config(state='normal', text="❌ Disable Hyper-V")
-
-    def _check_hyperv_powershell(self, dialog):
+        # Parse DISM output
+        match = self._DISM_STATE_RE.search(result.stdout)
+        return match.group(1) if match and match.group(1) in ("Enabled", "Disabled") else "Unknown"
+
+    def _query_hyperv_state_powershell(self):
         """Fallback method to check Hyper-V status using PowerShell."""
-        try:
-            ps_command = [
-                "powershell",
-                "-ExecutionPolicy", "Bypass",
-                "-Command",
-                "Get-WindowsOptionalFeature -Online -FeatureName Microsoft-Hyper-V-All | Select-Object State"
-            ]
+        ps_command = [
+            "powershell",
+            "-ExecutionPolicy", "Bypass",
+            "-Command",
+            "Get-WindowsOptionalFeature -Online -FeatureName Microsoft-Hyper-V-All | Select-Object State"
+        ]
 
-            result = subprocess.run(ps_command, capture_output=True, text=True, timeout=15, shell=True)
+        result = subprocess.run(
+            ps_command, capture_output=True, text=True, timeout=15,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        )
 
-            if result.returncode == 0:
-                output = result.stdout
-                state = "Unknown"
-
-                if 'Enabled' in output:
-                    state = "Enabled"
-                elif 'Disabled' in output:
-                    state = "Disabled"
-
-                status_text = f"Hyper-V Status: {state}"
-                self.hyperv_status_label.config(text=status_text)
-
-                # Update button based on status
-                if hasattr(self, 'hyperv_toggle_btn'):
-                    if state == "Disabled":
-                        self.hyperv_toggle_btn.config(
-                            text="✅ Enable Hyper-V",
-                            state='normal'
-                        )
-                        self.current_hyperv_action = True
-                    elif state == "Enabled":
-                        self.hyperv_toggle_btn.config(
-                            text="❌ Disable Hyper-V",
-                            state='normal'
-                        )
-                        self.current_hyperv_action = False
-                    else:
-                        self.hyperv_toggle_btn.config(text="❓ Status Unknown", state='disabled')
-            else:
-                self.hyperv_status_label.config(text="Unable to check Hyper-V status")
-                if hasattr(self, 'hyperv_toggle_btn'):
-                    self.hyperv_toggle_btn.config(text="❓ Status Unknown", state='disabled')
+        if result.returncode != 0:
+            return None
 
-        except Exception as e:
-            self.hyperv_status_label.config(text=f"PowerShell fallback failed: {str(e)}")
-            if hasattr(self, 'hyperv_toggle_btn'):
-                self.hyperv_toggle_btn.config(text="❓ Status Unknown", state='disabled')
+        output = result.stdout
+        if 'Enabled' in output:
+            return "Enabled"
+        if 'Disabled' in output:
+            return "Disabled"
+        return "Unknown"
 
+    def _check_hyperv_complete(self, dialog, state, error, generation=None):
+        """Show the Hyper-V status and enable the matching button."""
+        if not dialog.winfo_exists():
+            return
 
+        # A toggle started after this check; its own re-check will repaint
+        if generation is not None and generation != self._hyperv_check_generation:
+            return
+
+        if error is not None:
+            self.hyperv_status_label.config(text=f"Error checking status: {error}")
+        elif state is None:
+            self.hyperv_status_label.config(text="Unable to check Hyper-V status")
+        else:
+            self.hyperv_status_label.config(text=f"Hyper-V Status: {state}")
+
+        if not self._hyperv_buttons:
+            return
+
+        # Enable/disable buttons based on current status
+        if state == "Disabled":
+            # Hyper-V is disabled - enable "Enable" button, disable "Disable" button
+            self.enable_hyperv_btn.config(state='normal', text="✅ Enable Hyper-V")
+            self.disable_hyperv_btn.config(state='disabled', text="❌ Disable Hyper-V (Already Disabled)")
+        elif state == "Enabled":
+            # Hyper-V is enabled - enable "Disable" button, disable "Enable" button
+            self.enable_hyperv_btn.config(state='disabled', text="✅ Enable Hyper-V (Already Enabled)")
+            self.disable_hyperv_btn.config(state='normal', text="❌ Disable Hyper-V")
+        else:
+            # Status unknown or check failed - enable both buttons
+            self.enable_hyperv_btn.config(state='normal', text="✅ Enable Hyper-V")
+            self.disable_hyperv_btn.config(state='normal', text="❌ Disable Hyper-V")
 
     def toggle_hyperv_action(self, dialog, enable):
         """Handle Hyper-V toggle action."""
@@ -4349,8 +4803,9 @@ Disabling Hyper-V will:
                                  f"Continue?"):
             return
 
+        self._hyperv_check_generation += 1
         self.hyperv_status_label.config(text=f"{'Enabling' if enable else 'Disabling'} Hyper-V...")
-        dialog.update()
+        dialog.update_idletasks()
 
         # Run in background thread
         threading.Thread(target=self._hyperv_thread, args=(dialog, enable), daemon=True).start()
@@ -4371,14 +4826,15 @@ Disabling Hyper-V will:
         if success:
             messagebox.showinfo("Success", f"{message}\n\nPlease restart your computer to complete the changes.")
             # Refresh status to update buttons
+            self._hyperv_status_cache = None
+            self._hyperv_check_generation += 1
             self.check_hyperv_status(dialog)
         else:
             messagebox.showerror("Error", message)
             self.hyperv_status_label.config(text="Operation failed")
             # Re-enable both buttons
-            if hasattr(self, 'enable_hyperv_btn') and hasattr(self, 'disable_hyperv_btn'):
-                self.enable_hyperv_btn.config(state='normal')
-                self.disable_hyperv_btn.config(state='normal')
+            for button in self._hyperv_buttons:
+                button.config(state='normal')
 
     def export_services_dialog(self, dialog, format_type=None):
         """Show export services dialog or export directly if format specified."""
@@ -4388,91 +4844,17 @@ Disabling Hyper-V will:
 
         # If format is specified, export directly
         if format_type:
-            self.export_services_data(format_type)
+            self.export_services_data(self.all_services, format_type)
             return
 
-    def export_services_data(self, format_type):
-        """Export services data in specified format."""
-        try:
-            from tkinter import filedialog
-            import json
-            from datetime import datetime
-
-            # Get export options (default values)
-            include_stopped = True
-            include_descriptions = True
-
-            # Prepare data
-            export_data = {
-                'export_info': {
-                    'timestamp': datetime.now().isoformat(),
-                    'total_services': len(self.all_services),
-                    'format': format_type
-                },
-                'services': []
-            }
-
-            for service in self.all_services:
-                if not include_stopped and service.get('status', '').lower() != 'running':
-                    continue
-
-                service_data = {
-                    'name': service.get('name', ''),
-                    'display_name': service.get('display_name', ''),
-                    'status': service.get('status', ''),
-                    'startup_type': service.get('startup_type', ''),
-                    'category': service.get('category', 'Standard')
-                }
-
-                if include_descriptions:
-                    service_data['description'] = service.get('description', '')
-
-                export_data['services'].append(service_data)
-
-            # Choose file location
-            if format_type == 'json':
-                filename = filedialog.asksaveasfilename(
-                    defaultextension=".json",
-                    filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
-                    title="Save Services Export"
-                )
-                if filename:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(export_data, f, indent=2, ensure_ascii=False)
-                    messagebox.showinfo("Export Complete", f"Services exported to {filename}")
-
-            elif format_type == 'text':
-                filename = filedialog.asksaveasfilename(
-                    defaultextension=".txt",
-                    filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-                    title="Save Services Export"
-                )
-                if filename:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(f"Windows Services Export\n")
-                        f.write(f"Generated: {export_data['export_info']['timestamp']}\n")
-                        f.write(f"Total Services: {export_data['export_info']['total_services']}\n")
-                        f.write("=" * 80 + "\n\n")
-
-                        for service in export_data['services']:
-                            f.write(f"Service: {service['display_name']}\n")
-                            f.write(f"  Name: {service['name']}\n")
-                            f.write(f"  Status: {service['status']}\n")
-                            f.write(f"  Startup: {service['startup_type']}\n")
-                            f.write(f"  Category: {service['category']}\n")
-                            if include_descriptions and service.get('description'):
-                                f.write(f"  Description: {service['description']}\n")
-                            f.write("\n")
-
-                    messagebox.showinfo("Export Complete", f"Services exported to {filename}")
-
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export services:\n{str(e)}")
+        self._show_export_dialog(dialog)
 
+    def _show_export_dialog(self, dialog):
+        """Ask for the services export format and options."""
         # Ask for export format
         export_dialog = tk.Toplevel(dialog)
         export_dialog.title("Export Services")
-        export_dialog.geometry("400x300")
+        export_dialog.geometry("400x360")
         export_dialog.transient(dialog)
         export_dialog.grab_set()
         export_dialog.configure(background=self.colors["background"])
@@ -4492,10 +4874,16 @@ Disabling Hyper-V will:
 
         export_format = tk.StringVar(value="json")
 
-        json_radio = ttk.Radiobutton(format_frame, text="📄 JSON (Structured data)", variable=export_format, value="json", style="TRadiobutton")
+        json_radio = ttk.Radiobutton(format_frame, text="📄 JSON (Structured data)", variable=export_format, value="json")
         json_radio.pack(anchor=tk.W, pady=2)
 
-        text_radio = ttk.Radiobutton(format_frame, text="📝 Text (Human readable)", variable=export_format, value="text", style="TRadiobutton")
+        json_gz_radio = ttk.Radiobutton(format_frame, text="🗜️ JSON (gzip) (Compressed structured data)", variable=export_format, value="json_gz")
+        json_gz_radio.pack(anchor=tk.W, pady=2)
+
+        jsonl_radio = ttk.Radiobutton(format_frame, text="📃 JSON Lines (One service per line)", variable=export_format, value="jsonl")
+        jsonl_radio.pack(anchor=tk.W, pady=2)
+
+        text_radio = ttk.Radiobutton(format_frame, text="📝 Text (Human readable)", variable=export_format, value="text")
         text_radio.pack(anchor=tk.W, pady=2)
 
         # Options
@@ -4503,11 +4891,11 @@ Disabling Hyper-V will:
         options_frame.pack(fill=tk.X, pady=(0, 15))
 
         include_stopped = tk.BooleanVar(value=True)
-        include_stopped_cb = ttk.Checkbutton(options_frame, text="📋 Include stopped services", variable=include_stopped, style="TCheckbutton")
+        include_stopped_cb = ttk.Checkbutton(options_frame, text="📋 Include stopped services", variable=include_stopped)
         include_stopped_cb.pack(anchor=tk.W, pady=2)
 
         include_descriptions = tk.BooleanVar(value=True)
-        include_descriptions_cb = ttk.Checkbutton(options_frame, text="📝 Include service descriptions", variable=include_descriptions, style="TCheckbutton")
+        include_descriptions_cb = ttk.Checkbutton(options_frame, text="📝 Include service descriptions", variable=include_descriptions)
         include_descriptions_cb.pack(anchor=tk.W, pady=2)
 
         # Buttons
@@ -4534,110 +4922,192 @@ Disabling Hyper-V will:
     def perform_services_export(self, dialog, format_type, include_stopped, include_descriptions):
         """Perform the actual services export."""
         try:
-            # Filter services based on options
-            services_to_export = []
-            for service in self.all_services:
-                if not include_stopped and service['status'] != 'Running':
-                    continue
-
-                export_service = service.copy()
-                if not include_descriptions:
-                    export_service['description'] = ''
-
-                services_to_export.append(export_service)
+            # The status index already holds the running services, so no
+            # filtered copy of the list is needed
+            if include_stopped:
+                services_to_export = self.all_services
+            else:
+                services_to_export = self._services_by_status.get('Running', [])
 
             if not services_to_export:
                 messagebox.showwarning("No Data", "No services match the export criteria.")
                 return
 
-            # Export using the network export function (adapted for services)
-            success, message = self.export_services_data(services_to_export, format_type)
-
-            if success:
-                messagebox.showinfo("Export Successful", message)
-                dialog.destroy()
-            else:
-                if "cancelled" not in message.lower():
-                    messagebox.showerror("Export Failed", message)
+            # Export using the network export function (adapted for services);
+            # the options dialog closes once the file has been written
+            self.export_services_data(services_to_export, format_type, include_descriptions, dialog)
 
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export services data: {str(e)}")
 
-    def export_services_data(self, services, format_type):
-        """Export services data to file."""
-        import json
-        import datetime
-        import os
+    def export_services_data(self, services, format_type, include_descriptions=True, dialog=None):
+        """Ask where to save the services export, then write it on a worker thread.
 
-        try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        Args:
+            services: Service dicts to export, as loaded by the service manager
+            format_type: 'json', 'json_gz' (gzip-compressed JSON), 'jsonl'
+                (one JSON object per line) or 'text'
+            include_descriptions: Write each service's description
+            dialog: Export options dialog to close once the export succeeds
+        """
+        # One clock read per export; the filename, export_info and report
+        # header all format this same moment
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+        # Show file dialog
+        if format_type == 'json':
+            default_filename = f"windows_services_{timestamp}.json"
+            file_types = [("JSON files", "*.json"), ("All files", "*.*")]
+            extension = ".json"
+        elif format_type == 'json_gz':
+            default_filename = f"windows_services_{timestamp}.json.gz"
+            file_types = [("Compressed JSON files", "*.json.gz"), ("All files", "*.*")]
+            extension = ".json.gz"
+        elif format_type == 'jsonl':
+            default_filename = f"windows_services_{timestamp}.jsonl"
+            file_types = [("JSON Lines files", "*.jsonl"), ("All files", "*.*")]
+            extension = ".jsonl"
+        else:
+            default_filename = f"windows_services_{timestamp}.txt"
+            file_types = [("Text files", "*.txt"), ("All files", "*.*")]
+            extension = ".txt"
 
-            # Show file dialog
-            if format_type == 'json':
-                default_filename = f"windows_services_{timestamp}.json"
-                file_types = [("JSON files", "*.json"), ("All files", "*.*")]
-                extension = ".json"
-            else:
-                default_filename = f"windows_services_{timestamp}.txt"
-                file_types = [("Text files", "*.txt"), ("All files", "*.*")]
-                extension = ".txt"
+        filepath = filedialog.asksaveasfilename(
+            title=f"Save Windows Services Report ({format_type.replace('_', '.').upper()})",
+            defaultextension=extension,
+            filetypes=file_types,
+            initialfile=default_filename
+        )
 
-            filepath = filedialog.asksaveasfilename(
-                title=f"Save Windows Services Report ({format_type.upper()})",
-                defaultextension=extension,
-                filetypes=file_types,
-                initialfile=default_filename
-            )
+        if not filepath:  # User cancelled
+            return
 
-            if not filepath:  # User cancelled
-                return False, "Export cancelled by user"
+        # Serializing and writing a large list can take a while; keep it off the Tk thread.
+        # The worker gets a snapshot, since a refresh still streaming rows in
+        # keeps extending the live service lists
+        threading.Thread(target=self._services_export_thread,
+                        args=(list(services), format_type, include_descriptions, filepath, now, dialog), daemon=True).start()
 
-            if format_type == 'json':
-                export_data = {
-                    'export_info': {
-                        'timestamp': datetime.datetime.now().isoformat(),
-                        'date_readable': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'total_services': len(services),
-                        'format_version': '1.0',
-                        'export_type': 'windows_services'
-                    },
-                    'services': services
+    def _services_export_thread(self, services, format_type, include_descriptions, filepath, now, dialog):
+        """Background thread for writing a services export."""
+        success, message = self._write_services_export(services, format_type, include_descriptions, filepath, now)
+        self.root.after(0, lambda: self._services_export_complete(dialog, success, message))
+
+    def _services_export_complete(self, dialog, success, message):
+        """Handle services export completion."""
+        if success:
+            messagebox.showinfo("Export Successful", message)
+            if dialog is not None and dialog.winfo_exists():
+                dialog.destroy()
+        else:
+            messagebox.showerror("Export Failed", message)
+
+    def _write_services_export(self, services, format_type, include_descriptions, filepath, now=None):
+        """Write services data to filepath and return (success, message).
+
+        now is the datetime stamped into the export; defaults to the current time.
+        """
+        if now is None:
+            now = datetime.now()
+        date_readable = now.strftime('%Y-%m-%d %H:%M:%S')
+
+        try:
+            if format_type in ('json', 'json_gz', 'jsonl'):
+                export_info = {
+                    'timestamp': now.isoformat(),
+                    'date_readable': date_readable,
+                    'total_services': len(services),
+                    'format_version': '1.0',
+                    'export_type': 'windows_services'
                 }
 
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                # Leave out the private lookup keys added for filtering
+                def service_data(service):
+                    data = {key: value for key, value in service.items() if not key.startswith('_')}
+                    if not include_descriptions and 'description' in data:
+                        data['description'] = ''
+                    return data
+
+                if format_type == 'jsonl':
+                    if orjson is not None:
+                        encode = orjson.dumps
+                    else:
+                        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+                        encode = lambda obj: encoder.encode(obj).encode('utf-8')
+
+                    # An export_info line followed by one compact line per service,
+                    # so the file can be read back a record at a time
+                    with open(filepath, 'wb', buffering=1 << 20) as f:
+                        f.write(encode({'export_info': export_info}) + b'\n')
+                        for service in services:
+                            f.write(encode(service_data(service)) + b'\n')
+
+                else:
+                    if orjson is not None:
+                        # orjson encodes to UTF-8 bytes in one C call; the output
+                        # matches json.dumps(indent=2, ensure_ascii=False)
+                        encode = functools.partial(orjson.dumps, option=orjson.OPT_INDENT_2)
+                    else:
+                        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+                        encode = lambda obj: encoder.encode(obj).encode('utf-8')
+
+                    # Encode one service at a time instead of copying the whole list
+                    # into export_data first; the layout matches json.dump(..., indent=2)
+                    # of the full {'export_info': ..., 'services': [...]} dict.
+                    # Level 1 gzip keeps compression close to disk speed while
+                    # the repeated keys still shrink several times over
+                    if format_type == 'json_gz':
+                        output = gzip.open(filepath, 'wb', compresslevel=1)
+                    else:
+                        output = open(filepath, 'wb', buffering=1 << 20)
+                    with output as f:
+                        f.write(b'{\n  "export_info": ')
+                        f.write(encode(export_info).replace(b'\n', b'\n  '))
+                        f.write(b',\n  "services": [')
+                        separator = b'\n    '
+                        for service in services:
+                            f.write(separator)
+                            f.write(encode(service_data(service)).replace(b'\n', b'\n    '))
+                            separator = b',\n    '
+                        f.write(b']\n}' if separator == b'\n    ' else b'\n  ]\n}')
 
             else:  # text format
-                with open(filepath, 'w', encoding='utf-8') as f:
+                # A 1 MiB buffer coalesces the many small report writes into a
+                # few flushes
+                with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
                     # Header
                     f.write("=" * 80 + "\n")
                     f.write("WINDOWS SERVICES REPORT\n")
                     f.write("=" * 80 + "\n")
-                    f.write(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    f.write(f"Generated: {date_readable}\n")
                     f.write(f"Total Services: {len(services)}\n")
                     f.write("=" * 80 + "\n\n")
 
-                    # Group services by category
-                    categories = {}
+                    # Group services by category; category sizes come from the groups
+                    categories = defaultdict(list)
                     for service in services:
-                        category = service.get('category', 'Unknown')
-                        if category not in categories:
-                            categories[category] = []
-                        categories[category].append(service)
+                        categories[service.get('category', 'Unknown')].append(service)
+                    sorted_categories = sorted(categories)
+
+                    # Counter over itemgetter tallies statuses without a Python-level loop
+                    status_counts = Counter(map(itemgetter('status'), services))
 
                     # Write services by category
-                    for category, category_services in sorted(categories.items()):
+                    for category in sorted_categories:
+                        category_services = categories[category]
                         f.write(f"CATEGORY: {category.upper()}\n")
                         f.write("-" * 60 + "\n")
 
-                        for service in sorted(category_services, key=lambda x: x['name']):
-                            f.write(f"Service Name: {service['name']}\n")
-                            f.write(f"Display Name: {service['display_name']}\n")
-                            f.write(f"Status: {service['status']}\n")
-                            f.write(f"Startup Type: {service['start_type']}\n")
-                            if service.get('description'):
-                                f.write(f"Description: {service['description']}\n")
-                            f.write("\n")
+                        # One formatted block per service instead of a write per field
+                        template = self._SERVICE_REPORT_TEMPLATE
+                        f.writelines(
+                            template.format_map(service)
+                            + (f"Description: {service['description']}\n"
+                               if include_descriptions and service.get('description') else "")
+                            + "\n"
+                            for service in sorted(category_services, key=itemgetter('name'))
+                        )
 
                         f.write("\n")
 
@@ -4647,19 +5117,14 @@ Disabling Hyper-V will:
                     f.write("=" * 80 + "\n")
 
                     # Count by status
-                    status_counts = {}
-                    for service in services:
-                        status = service['status']
-                        status_counts[status] = status_counts.get(status, 0) + 1
-
                     f.write("Services by Status:\n")
                     for status, count in sorted(status_counts.items()):
                         f.write(f"  {status}: {count}\n")
 
-                    # Count by category
+                    # Count by category, reusing the grouping and its sort order
                     f.write("\nServices by Category:\n")
-                    for category, count in sorted([(cat, len(svcs)) for cat, svcs in categories.items()]):
-                        f.write(f"  {category}: {count}\n")
+                    for category in sorted_categories:
+                        f.write(f"  {category}: {len(categories[category])}\n")
 
             filename = os.path.basename(filepath)
             return True, f"Successfully exported to {filename}"
@@ -4673,6 +5138,13 @@ Disabling Hyper-V will:
     
     def _show_cleanup_results(self, cleanup_results):
         """Show results of cleanup operations."""
+        # Reuse the pooled dialog and just refill its text
+        dialog = self._get_pooled_dialog('cleanup_results')
+        if dialog is not None:
+            self._populate_cleanup_results(cleanup_results)
+            self._show_pooled_dialog(dialog)
+            return
+
         # Create dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Cleanup Results")
@@ -4694,77 +5166,31 @@ Disabling Hyper-V will:
             style="Title.TLabel"
         ).pack(pady=(0, 10), anchor=tk.W)
         
-        # Summary counts
-        success_count = len(cleanup_results["success"])
-        failed_count = len(cleanup_results["failed"])
-        
-        ttk.Label(
-            main_frame,
-            text=f"Successfully completed: {success_count} operations\nFailed: {failed_count} operations",
-            style="Info.TLabel"
-        ).pack(pady=(0, 15), anchor=tk.W)
+        # Summary counts (filled in by _populate_cleanup_results)
+        summary_label = ttk.Label(main_frame, style="Info.TLabel")
+        summary_label.pack(pady=(0, 15), anchor=tk.W)
         
         # Create notebook for results
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
         
-        # Success tab
-        success_frame = ttk.Frame(notebook, padding=10)
-        notebook.add(success_frame, text=f"Successful ({success_count})")
-        
-        if success_count > 0:
-            # Create text widget for success results
-            success_text = tk.Text(success_frame, wrap=tk.WORD, height=15,
-                                 background=self.colors["background"],
-                                 foreground=self.colors["text_primary"],
-                                 insertbackground=self.colors["text_primary"])
-            success_text.pack(fill=tk.BOTH, expand=True)
-            
-            # Add scrollbar
-            success_scrollbar = ttk.Scrollbar(success_frame, command=success_text.yview)
-            success_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            success_text.config(yscrollcommand=success_scrollbar.set)
-            
-            # Insert success results
-            for option, message in cleanup_results["success"]:
-                success_text.insert(tk.END, f"✅ {message}\n\n")
-                
-            success_text.config(state=tk.DISABLED)  # Make read-only
-        else:
-            ttk.Label(
-                success_frame,
-                text="No successful operations",
-                style="Info.TLabel"
-            ).pack(pady=20)
-        
-        # Failed tab
-        failed_frame = ttk.Frame(notebook, padding=10)
-        notebook.add(failed_frame, text=f"Failed ({failed_count})")
-        
-        if failed_count > 0:
-            # Create text widget for failed results
-            failed_text = tk.Text(failed_frame, wrap=tk.WORD, height=15,
-                                background=self.colors["background"],
-                                foreground=self.colors["text_primary"],
-                                insertbackground=self.colors["text_primary"])
-            failed_text.pack(fill=tk.BOTH, expand=True)
-            
-            # Add scrollbar
-            failed_scrollbar = ttk.Scrollbar(failed_frame, command=failed_text.yview)
-            failed_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            failed_text.config(yscrollcommand=failed_scrollbar.set)
-            
-            # Insert failed results
-            for option, message in cleanup_results["failed"]:
-                failed_text.insert(tk.END, f"❌ {message}\n\n")
-                
-            failed_text.config(state=tk.DISABLED)  # Make read-only
-        else:
-            ttk.Label(
-                failed_frame,
-                text="No failed operations",
-                style="Info.TLabel"
-            ).pack(pady=20)
+        # One tab each for successful and failed operations; the text view and
+        # the empty-state label are swapped in as the results require
+        tabs = {}
+        for key, empty_text in (("success", "No successful operations"), ("failed", "No failed operations")):
+            tab_frame = ttk.Frame(notebook, padding=10)
+            notebook.add(tab_frame)
+
+            text_frame = ttk.Frame(tab_frame)
+            result_text = tk.Text(text_frame, wrap=tk.WORD, height=15)
+            scrollbar = ttk.Scrollbar(text_frame, command=result_text.yview)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            result_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            result_text.config(yscrollcommand=scrollbar.set)
+
+            empty_label = ttk.Label(tab_frame, text=empty_text, style="Info.TLabel")
+
+            tabs[key] = (tab_frame, text_frame, result_text, empty_label)
         
         # Add finish button with proper reference to dialog
         finish_button = ttk.Button(
@@ -4773,9 +5199,48 @@ Disabling Hyper-V will:
             width=12,  # Set explicit width to ensure text is visible
             style="Secondary.TButton"
         )
-        finish_button.configure(command=dialog.destroy)
+        finish_button.configure(command=lambda: self._hide_pooled_dialog(dialog))
         finish_button.pack(side=tk.RIGHT, padx=10, pady=10, ipady=5)  # Add padding and increase height
-        
+
+        self.cleanup_summary_label = summary_label
+        self.cleanup_notebook = notebook
+        self.cleanup_result_tabs = tabs
+        self._register_pooled_dialog('cleanup_results', dialog)
+
+        self._populate_cleanup_results(cleanup_results)
+
+    def _populate_cleanup_results(self, cleanup_results):
+        """Fill the pooled cleanup results dialog with cleanup_results."""
+        success_count = len(cleanup_results["success"])
+        failed_count = len(cleanup_results["failed"])
+
+        self.cleanup_summary_label.config(
+            text=f"Successfully completed: {success_count} operations\nFailed: {failed_count} operations"
+        )
+
+        for key, title, icon in (("success", "Successful", "✅"), ("failed", "Failed", "❌")):
+            tab_frame, text_frame, result_text, empty_label = self.cleanup_result_tabs[key]
+            results = cleanup_results[key]
+            self.cleanup_notebook.tab(tab_frame, text=f"{title} ({len(results)})")
+
+            if not results:
+                text_frame.pack_forget()
+                empty_label.pack(pady=20)
+                continue
+
+            empty_label.pack_forget()
+            text_frame.pack(fill=tk.BOTH, expand=True)
+
+            # Colors are re-applied in case the theme changed since the last show
+            result_text.config(state=tk.NORMAL,
+                               background=self.colors["background"],
+                               foreground=self.colors["text_primary"],
+                               insertbackground=self.colors["text_primary"])
+            result_text.delete("1.0", tk.END)
+            # Build the whole listing first so it goes to Tk in a single insert
+            result_text.insert(tk.END, "".join(f"{icon} {message}\n\n" for option, message in results))
+            result_text.config(state=tk.DISABLED)  # Make read-only
+
         # Update status
         self.status_var.set(f"Cleanup completed: {success_count} successful, {failed_count} failed")
     
@@ -4789,244 +5254,295 @@ Disabling Hyper-V will:
         except:
             pass
 
-        # Modern frame styles - explicit theme backgrounds
-        style.configure("Card.TFrame",
-                      background=self.colors["background"],
-                      relief="flat",
-                      borderwidth=0)
-
-        style.configure("Surface.TFrame",
-                      background=self.colors["background"],
-                      relief="flat",
-                      borderwidth=0)
-
-        # Default TFrame style with theme background
-        style.configure("TFrame",
-                      background=self.colors["background"],
-                      relief="flat",
-                      borderwidth=0)
-
-        # Default TLabel style with theme background
-        style.configure("TLabel",
-                      background=self.colors["background"],
-                      foreground=self.colors["text_primary"])
-
-        # Default TButton style with theme background
-        style.configure("TButton",
-                      background=self.colors["background"],
-                      foreground=self.colors["text_primary"])
-
-        # Default TEntry style with modern appearance
-        style.configure("TEntry",
-                      fieldbackground=self.colors["background"],
-                      foreground=self.colors["text_primary"],
-                      borderwidth=2,
-                      relief="solid",
-                      bordercolor=self.colors["border"],
-                      insertcolor=self.colors["primary"],
-                      font=('Segoe UI', 10),
-                      padding=(8, 6))
-
-        # Default TCombobox style with modern appearance
-        style.configure("TCombobox",
-                      fieldbackground=self.colors["background"],
-                      foreground=self.colors["text_primary"],
-                      background=self.colors["background"],
-                      borderwidth=2,
-                      relief="solid",
-                      bordercolor=self.colors["border"],
-                      font=('Segoe UI', 10),
-                      padding=(8, 6),
-                      arrowcolor=self.colors["text_primary"])
-
-        # Modern treeview styling - clean backgrounds
-        style.configure("Treeview",
-                      rowheight=35,
-                      background=self.colors["background"],
-                      fieldbackground=self.colors["background"],
-                      foreground=self.colors["text_primary"],
-                      font=('Segoe UI', 10),
-                      borderwidth=0,
-                      relief="flat")
-
-        style.configure("Treeview.Heading",
-                      font=('Segoe UI', 11, 'bold'),
-                      background=self.colors["primary"],
-                      foreground="white",
-                      relief="flat",
-                      borderwidth=0)
-
-        # Enhanced treeview interactions
-        style.map('Treeview',
-                background=[('selected', self.colors["primary"]),
-                          ('focus', self.colors["hover"])],
-                foreground=[('selected', self.colors["background"] if self.theme_mode == "light" else self.colors["text_primary"])])
-
-        style.map('Treeview.Heading',
-                background=[('active', self.colors["primary_dark"])])
-
-        # Modern button styles with enhanced visual feedback
-        style.configure("Primary.TButton",
-                      font=('Segoe UI', 11, 'bold'),
-                      background=self.colors["primary"],
-                      foreground=self.colors["background"] if self.theme_mode == "light" else self.colors["text_primary"],
-                      borderwidth=0,
-                      focuscolor='none',
-                      relief="flat",
-                      padding=(20, 10))
-
-        style.map("Primary.TButton",
-                background=[('active', self.colors["primary_dark"]),
-                          ('pressed', self.colors["primary_dark"])],
-                relief=[('pressed', 'flat')])
-
-        style.configure("Secondary.TButton",
-                      font=('Segoe UI', 10, 'bold'),
-                      background=self.colors["background"],
-                      foreground=self.colors["text_primary"],
-                      borderwidth=1,
-                      focuscolor='none',
-                      relief="flat",
-                      padding=(15, 8))
-
-        style.map("Secondary.TButton",
-                background=[('active', self.colors["hover"]),
-                          ('pressed', self.colors["active"])],
-                bordercolor=[('focus', self.colors["primary"])])
-
-        style.configure("Action.TButton",
-                      font=('Segoe UI', 10, 'bold'),
-                      background=self.colors["accent"],
-                      foreground=self.colors["background"] if self.theme_mode == "light" else self.colors["text_primary"],
-                      borderwidth=0,
-                      focuscolor='none',
-                      relief="flat",
-                      padding=(15, 8))
-
-        style.map("Action.TButton",
-                background=[('active', self.colors["secondary"]),
-                          ('pressed', self.colors["secondary"])])
-
-        # Modern label styles with explicit theme backgrounds
-        style.configure("Title.TLabel",
-                      font=('Segoe UI', 20, 'bold'),
-                      foreground=self.colors["text_primary"],
-                      background=self.colors["background"])
-
-        style.configure("Subtitle.TLabel",
-                      font=('Segoe UI', 14, 'bold'),
-                      foreground=self.colors["text_primary"],
-                      background=self.colors["background"])
-
-        style.configure("Info.TLabel",
-                      font=('Segoe UI', 10),
-                      foreground=self.colors["text_secondary"],
-                      background=self.colors["background"])
-
-        style.configure("Caption.TLabel",
-                      font=('Segoe UI', 9),
-                      foreground=self.colors["text_tertiary"],
-                      background=self.colors["background"])
-
-        # Modern entry styles with enhanced appearance
-        style.configure("TEntry",
-                      fieldbackground=self.colors["background"],
-                      foreground=self.colors["text_primary"],
-                      borderwidth=2,
-                      relief="solid",
-                      insertcolor=self.colors["primary"],
-                      font=('Segoe UI', 10),
-                      padding=(8, 6))
-
-        style.map("TEntry",
-                bordercolor=[('focus', self.colors["primary"]),
-                           ('!focus', self.colors["border"])],
-                fieldbackground=[('readonly', self.colors["surface"]),
-                               ('disabled', self.colors["surface"])])
-
-        # Modern combobox styles with enhanced appearance
-        style.configure("TCombobox",
-                      fieldbackground=self.colors["background"],
-                      foreground=self.colors["text_primary"],
-                      background=self.colors["background"],
-                      borderwidth=2,
-                      relief="solid",
-                      font=('Segoe UI', 10),
-                      padding=(8, 6),
-                      arrowcolor=self.colors["text_primary"])
-
-        style.map("TCombobox",
-                bordercolor=[('focus', self.colors["primary"]),
-                           ('!focus', self.colors["border"])],
-                fieldbackground=[('readonly', self.colors["background"]),
-                               ('disabled', self.colors["surface"])],
-                background=[('active', self.colors["hover"]),
-                          ('pressed', self.colors["active"])])
-
-        # Combobox dropdown styling
-        style.configure("TCombobox.Listbox",
-                      background=self.colors["background"],
-                      foreground=self.colors["text_primary"],
-                      selectbackground=self.colors["primary"],
-                      selectforeground="white",
-                      borderwidth=1,
-                      relief="solid")
-
-        # Modern progressbar - clean background
-        style.configure("TProgressbar",
-                      background=self.colors["primary"],
-                      troughcolor=self.colors["background"],
-                      borderwidth=0,
-                      lightcolor=self.colors["primary"],
-                      darkcolor=self.colors["primary"])
-
-        # Modern separator with theme background
-        style.configure("TSeparator",
-                      background=self.colors["background"])
-
-        # Modern checkbutton with enhanced styling
-        style.configure("TCheckbutton",
-                      foreground=self.colors["text_primary"],
-                      background=self.colors["background"],
-                      focuscolor='none',
-                      font=('Segoe UI', 10),
-                      borderwidth=0,
-                      relief="flat")
-
-        style.map("TCheckbutton",
-                 background=[('active', self.colors["hover"]),
-                           ('pressed', self.colors["active"])],
-                 foreground=[('active', self.colors["text_primary"]),
-                           ('disabled', self.colors["text_tertiary"])])
-
-        # Modern labelframe with enhanced styling
-        style.configure("TLabelframe",
-                      foreground=self.colors["text_primary"],
-                      background=self.colors["background"],
-                      borderwidth=1,
-                      relief="solid",
-                      bordercolor=self.colors["border"])
+        # Hoist the colors and fonts used throughout the settings below
+        colors = self.colors
+        background = colors["background"]
+        text_primary = colors["text_primary"]
+        border = colors["border"]
+        primary = colors["primary"]
+        surface = colors["surface"]
+        hover = colors["hover"]
+        active = colors["active"]
+        primary_dark = colors["primary_dark"]
+        accent = colors["accent"]
+        secondary = colors["secondary"]
+        text_secondary = colors["text_secondary"]
+        text_tertiary = colors["text_tertiary"]
+
+        # Text drawn on primary/accent fills
+        on_primary = background if self.theme_mode == "light" else text_primary
+        font_normal = ('Segoe UI', 10)
+        font_bold = ('Segoe UI', 10, 'bold')
+        font_heading = ('Segoe UI', 11, 'bold')
+
+        # Every style below is applied with one theme_settings call, which Tk
+        # runs as a single script instead of a round-trip per configure/map
+        settings = {
+            # Modern frame styles - explicit theme backgrounds
+            "Card.TFrame": {
+                "configure": {
+                    "background": background,
+                    "relief": "flat",
+                    "borderwidth": 0
+                }
+            },
+            "Surface.TFrame": {
+                "configure": {
+                    "background": background,
+                    "relief": "flat",
+                    "borderwidth": 0
+                }
+            },
+            # Default TFrame style with theme background
+            "TFrame": {
+                "configure": {
+                    "background": background,
+                    "relief": "flat",
+                    "borderwidth": 0
+                }
+            },
+            # Default TLabel style with theme background
+            "TLabel": {
+                "configure": {
+                    "background": background,
+                    "foreground": text_primary
+                }
+            },
+            # Default TButton style with theme background
+            "TButton": {
+                "configure": {
+                    "background": background,
+                    "foreground": text_primary
+                }
+            },
+            # Modern entry styles with enhanced appearance
+            "TEntry": {
+                "configure": {
+                    "fieldbackground": background,
+                    "foreground": text_primary,
+                    "borderwidth": 2,
+                    "relief": "solid",
+                    "insertcolor": primary,
+                    "font": font_normal,
+                    "padding": (8, 6)
+                },
+                "map": {
+                    "bordercolor": [('focus', primary),
+                                    ('!focus', border)],
+                    "fieldbackground": [('readonly', surface),
+                                        ('disabled', surface)]
+                }
+            },
+            # Modern combobox styles with enhanced appearance
+            "TCombobox": {
+                "configure": {
+                    "fieldbackground": background,
+                    "foreground": text_primary,
+                    "background": background,
+                    "borderwidth": 2,
+                    "relief": "solid",
+                    "font": font_normal,
+                    "padding": (8, 6),
+                    "arrowcolor": text_primary
+                },
+                "map": {
+                    "bordercolor": [('focus', primary),
+                                    ('!focus', border)],
+                    "fieldbackground": [('readonly', background),
+                                        ('disabled', surface)],
+                    "background": [('active', hover),
+                                   ('pressed', active)]
+                }
+            },
+            # Modern treeview styling - clean backgrounds
+            "Treeview": {
+                "configure": {
+                    "rowheight": 35,
+                    "background": background,
+                    "fieldbackground": background,
+                    "foreground": text_primary,
+                    "font": font_normal,
+                    "borderwidth": 0,
+                    "relief": "flat"
+                },
+                # Enhanced treeview interactions
+                "map": {
+                    "background": [('selected', primary),
+                                   ('focus', hover)],
+                    "foreground": [('selected', on_primary)]
+                }
+            },
+            "Treeview.Heading": {
+                "configure": {
+                    "font": font_heading,
+                    "background": primary,
+                    "foreground": "white",
+                    "relief": "flat",
+                    "borderwidth": 0
+                },
+                "map": {
+                    "background": [('active', primary_dark)]
+                }
+            },
+            # Modern button styles with enhanced visual feedback
+            "Primary.TButton": {
+                "configure": {
+                    "font": font_heading,
+                    "background": primary,
+                    "foreground": on_primary,
+                    "borderwidth": 0,
+                    "focuscolor": 'none',
+                    "relief": "flat",
+                    "padding": (20, 10)
+                },
+                "map": {
+                    "background": [('active', primary_dark),
+                                   ('pressed', primary_dark)],
+                    "relief": [('pressed', 'flat')]
+                }
+            },
+            "Secondary.TButton": {
+                "configure": {
+                    "font": font_bold,
+                    "background": background,
+                    "foreground": text_primary,
+                    "borderwidth": 1,
+                    "focuscolor": 'none',
+                    "relief": "flat",
+                    "padding": (15, 8)
+                },
+                "map": {
+                    "background": [('active', hover),
+                                   ('pressed', active)],
+                    "bordercolor": [('focus', primary)]
+                }
+            },
+            "Action.TButton": {
+                "configure": {
+                    "font": font_bold,
+                    "background": accent,
+                    "foreground": on_primary,
+                    "borderwidth": 0,
+                    "focuscolor": 'none',
+                    "relief": "flat",
+                    "padding": (15, 8)
+                },
+                "map": {
+                    "background": [('active', secondary),
+                                   ('pressed', secondary)]
+                }
+            },
+            # Modern label styles with explicit theme backgrounds
+            "Title.TLabel": {
+                "configure": {
+                    "font": ('Segoe UI', 20, 'bold'),
+                    "foreground": text_primary,
+                    "background": background
+                }
+            },
+            "Subtitle.TLabel": {
+                "configure": {
+                    "font": ('Segoe UI', 14, 'bold'),
+                    "foreground": text_primary,
+                    "background": background
+                }
+            },
+            "Info.TLabel": {
+                "configure": {
+                    "font": font_normal,
+                    "foreground": text_secondary,
+                    "background": background
+                }
+            },
+            "Caption.TLabel": {
+                "configure": {
+                    "font": ('Segoe UI', 9),
+                    "foreground": text_tertiary,
+                    "background": background
+                }
+            },
+            # Combobox dropdown styling
+            "TCombobox.Listbox": {
+                "configure": {
+                    "background": background,
+                    "foreground": text_primary,
+                    "selectbackground": primary,
+                    "selectforeground": "white",
+                    "borderwidth": 1,
+                    "relief": "solid"
+                }
+            },
+            # Modern progressbar - clean background
+            "TProgressbar": {
+                "configure": {
+                    "background": primary,
+                    "troughcolor": background,
+                    "borderwidth": 0,
+                    "lightcolor": primary,
+                    "darkcolor": primary
+                }
+            },
+            # Modern separator with theme background
+            "TSeparator": {
+                "configure": {
+                    "background": background
+                }
+            },
+            # Modern checkbutton with enhanced styling
+            "TCheckbutton": {
+                "configure": {
+                    "foreground": text_primary,
+                    "background": background,
+                    "focuscolor": 'none',
+                    "font": font_normal,
+                    "borderwidth": 0,
+                    "relief": "flat"
+                },
+                "map": {
+                    "background": [('active', hover),
+                                   ('pressed', active)],
+                    "foreground": [('active', text_primary),
+                                   ('disabled', text_tertiary)]
+                }
+            },
+            # Modern labelframe with enhanced styling
+            "TLabelframe": {
+                "configure": {
+                    "foreground": text_primary,
+                    "background": background,
+                    "borderwidth": 1,
+                    "relief": "solid",
+                    "bordercolor": border
+                }
+            },
+            "TLabelframe.Label": {
+                "configure": {
+                    "foreground": text_primary,
+                    "background": background,
+                    "font": font_bold
+                }
+            },
+            # Modern radiobutton with enhanced styling
+            "TRadiobutton": {
+                "configure": {
+                    "foreground": text_primary,
+                    "background": background,
+                    "focuscolor": 'none',
+                    "font": font_normal,
+                    "borderwidth": 0,
+                    "relief": "flat"
+                },
+                "map": {
+                    "background": [('active', hover),
+                                   ('pressed', active)],
+                    "foreground": [('active', text_primary),
+                                   ('disabled', text_tertiary)]
+                }
+            }
+        }
 
-        style.configure("TLabelframe.Label",
-                      foreground=self.colors["text_primary"],
-                      background=self.colors["background"],
-                      font=('Segoe UI', 10, 'bold'))
+        style.theme_settings(style.theme_use(), settings)
 
-        # Modern radiobutton with enhanced styling
-        style.configure("TRadiobutton",
-                      foreground=self.colors["text_primary"],
-                      background=self.colors["background"],
-                      focuscolor='none',
-                      font=('Segoe UI', 10),
-                      borderwidth=0,
-                      relief="flat")
-
-        style.map("TRadiobutton",
-                 background=[('active', self.colors["hover"]),
-                           ('pressed', self.colors["active"])],
-                 foreground=[('active', self.colors["text_primary"]),
-                           ('disabled', self.colors["text_tertiary"])])
-    
     def create_widgets(self):
         """Create and arrange GUI widgets with modern styling."""
         # Set background color for root window
@@ -5096,32 +5612,16 @@ Disabling Hyper-V will:
         version_label = ttk.Label(control_panel, text="Version Tools", style="Subtitle.TLabel")
         version_label.grid(row=1, column=0, sticky=tk.W, pady=(0, 10))
 
-        # Main action button
-        self.refresh_btn = ttk.Button(
-            control_panel,
-            text="🔄 Check Versions",
-            command=self.start_version_check,
-            style="Primary.TButton"
+        # Version action buttons: (attribute, text, command, row, ipady)
+        version_buttons = (
+            ('refresh_btn', "🔄 Check Versions", self.start_version_check, 2, 5),
+            ('auto_install_btn', "🔄 Auto Install Packages", self.auto_install_from_backup, 3, 3),
+            ('import_json_btn', "📥 Import JSON", self.import_json, 4, 3),
         )
-        self.refresh_btn.grid(row=2, column=0, pady=(0, 5), sticky=tk.W+tk.E, ipady=5)
-
-        # Auto install packages button
-        self.auto_install_btn = ttk.Button(
-            control_panel,
-            text="🔄 Auto Install Packages",
-            command=self.auto_install_from_backup,
-            style="Primary.TButton"
-        )
-        self.auto_install_btn.grid(row=3, column=0, pady=(0, 5), sticky=tk.W+tk.E, ipady=3)
-
-        # Import JSON button
-        self.import_json_btn = ttk.Button(
-            control_panel,
-            text="📥 Import JSON",
-            command=self.import_json,
-            style="Primary.TButton"
-        )
-        self.import_json_btn.grid(row=4, column=0, pady=(0, 5), sticky=tk.W+tk.E, ipady=3)
+        for attribute, text, command, row, ipady in version_buttons:
+            button = ttk.Button(control_panel, text=text, command=command, style="Primary.TButton")
+            button.grid(row=row, column=0, pady=(0, 5), sticky=tk.W+tk.E, ipady=ipady)
+            setattr(self, attribute, button)
 
         # Export dropdown
         self.export_var = tk.StringVar(value="📤 Export")
@@ -5130,8 +5630,7 @@ Disabling Hyper-V will:
             textvariable=self.export_var,
             values=["📤 Export", "📄 JSON", "📝 Text"],
             state="disabled",
-            width=20,
-            style="TCombobox"
+            width=20
         )
         self.export_combo.grid(row=5, column=0, pady=(0, 5), sticky=tk.W+tk.E)
         self.export_combo.bind("<<ComboboxSelected>>", self.on_export_selected)
@@ -5152,54 +5651,10 @@ Disabling Hyper-V will:
         ram_label = ttk.Label(control_panel, text="System Monitor", style="Subtitle.TLabel")
         ram_label.grid(row=8, column=0, sticky=tk.W, pady=(0, 10))
 
-        self.ram_monitor_btn = ttk.Button(
-            control_panel,
-            text="🖥️ RAM Usage Monitor",
-            command=self.show_ram_monitor,
-            style="Action.TButton"
-        )
-        self.ram_monitor_btn.grid(row=9, column=0, pady=(0, 5), sticky=tk.W+tk.E, ipady=3)
-
-        self.speed_test_btn = ttk.Button(
-            control_panel,
-            text="🌐 Internet Speed Test",
-            command=self.show_speed_test,
-            style="Action.TButton"
-        )
-        self.speed_test_btn.grid(row=10, column=0, pady=(0, 5), sticky=tk.W+tk.E, ipady=3)
-
-        self.network_monitor_btn = ttk.Button(
-            control_panel,
-            text="🔗 Network Monitor",
-            command=self.show_network_monitor,
-            style="Action.TButton"
-        )
-        self.network_monitor_btn.grid(row=11, column=0, pady=(0, 5), sticky=tk.W+tk.E, ipady=3)
-
-        self.service_manager_btn = ttk.Button(
-            control_panel,
-            text="🔧 Service Manager",
-            command=self.show_service_manager,
-            style="Action.TButton"
-        )
-        self.service_manager_btn.grid(row=12, column=0, pady=(0, 5), sticky=tk.W+tk.E, ipady=3)
-
-        self.hardware_info_btn = ttk.Button(
-            control_panel,
-            text="💻 Hardware Info",
-            command=self.show_hardware_info,
-            style="Action.TButton"
-        )
-        self.hardware_info_btn.grid(row=13, column=0, pady=(0, 5), sticky=tk.W+tk.E, ipady=3)
-
-        self.startup_manager_btn = ttk.Button(
-            control_panel,
-            text="🚀 Startup Manager",
-            command=self.show_startup_manager,
-            style="Action.TButton",
-            takefocus=False
-        )
-        self.startup_manager_btn.grid(row=14, column=0, pady=(0, 10), sticky=tk.W+tk.E, ipady=3)
+        # The system monitor buttons are only built when first asked for
+        more_tools_btn = ttk.Button(control_panel, text="🧰 More Tools…", style="Action.TButton")
+        more_tools_btn.configure(command=lambda: self._show_monitor_buttons(control_panel, more_tools_btn))
+        more_tools_btn.grid(row=9, column=0, pady=(0, 10), sticky=tk.W+tk.E, ipady=3)
 
         # Instructions card
         info_frame = ttk.Frame(control_panel, padding="10", style="Card.TFrame")
@@ -5253,6 +5708,7 @@ Disabling Hyper-V will:
         # Bind events for installation
         self.tree.bind('<Double-1>', self.on_tree_double_click)
         self.tree.bind('<<TreeviewSelect>>', self.on_tree_select)
+        self.tree.bind('<<TreeviewOpen>>', self._on_category_open)
         
         # Modern scrollbars
         v_scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
@@ -5320,8 +5776,7 @@ Disabling Hyper-V will:
         self.status_var.set("Checking versions... This may take a moment.")
 
         # Clear previous results
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._clear_tree()
 
         # Start checking in background thread
         thread = threading.Thread(target=self.check_versions_thread)
@@ -5329,55 +5784,122 @@ Disabling Hyper-V will:
         thread.start()
 
         # Set a timeout to prevent hanging (2 minutes max)
-        self.root.after(120000, self.check_timeout)
+        self._cancel_check_timeout()
+        self._check_timeout_id = self.root.after(120000, self.check_timeout)
     
     def check_versions_thread(self):
         """Background thread for version checking."""
         try:
             def progress_callback(current, total, tool_name):
-                # Update status in main thread
-                self.root.after(0, lambda: self.status_var.set(f"Checking {tool_name}... ({current}/{total})"))
+                self._post_status(self.status_var, f"Checked {tool_name} ({current}/{total})")
 
             self.results = self.version_checker.check_all_versions(progress_callback)
+            # Drop any progress message still queued so it can't overwrite the results
+            self._discard_status(self.status_var)
             # Schedule GUI update in main thread
             self.root.after(0, self.update_results)
         except Exception as e:
-            self.root.after(0, lambda: self.show_error(f"Error checking versions: {str(e)}"))
+            self._discard_status(self.status_var)
+            error = str(e)
+            self.root.after(0, lambda: self.show_error(f"Error checking versions: {error}"))
     
+    def _show_monitor_buttons(self, control_panel, more_tools_btn):
+        """Replace the More Tools button with the system monitor buttons."""
+        more_tools_btn.destroy()
+
+        # System monitor buttons: (attribute, text, command, extra options)
+        monitor_buttons = (
+            ('ram_monitor_btn', "🖥️ RAM Usage Monitor", self.show_ram_monitor, {}),
+            ('speed_test_btn', "🌐 Internet Speed Test", self.show_speed_test, {}),
+            ('network_monitor_btn', "🔗 Network Monitor", self.show_network_monitor, {}),
+            ('service_manager_btn', "🔧 Service Manager", self.show_service_manager, {}),
+            ('hardware_info_btn', "💻 Hardware Info", self.show_hardware_info, {}),
+            ('startup_manager_btn', "🚀 Startup Manager", self.show_startup_manager, {'takefocus': False}),
+        )
+        last_row = 8 + len(monitor_buttons)
+        for row, (attribute, text, command, options) in enumerate(monitor_buttons, start=9):
+            button = ttk.Button(control_panel, text=text, command=command, style="Action.TButton", **options)
+            button.grid(row=row, column=0, pady=(0, 10 if row == last_row else 5), sticky=tk.W+tk.E, ipady=3)
+            setattr(self, attribute, button)
+
+    def _clear_tree(self):
+        """Remove every row from the results tree along with its row bookkeeping."""
+        items = self.tree.get_children()
+        if items:
+            self.tree.delete(*items)
+        self._pending_children.clear()
+        self._row_meta.clear()
+
+    def _post_status(self, variable, message):
+        """Queue a progress message for a StringVar from a worker thread.
+
+        Only the newest message per variable is kept and at most one flush is
+        queued on the main thread, so chatty progress callbacks can't flood Tk.
+        """
+        with self._status_lock:
+            schedule = not self._pending_status
+            # Tk variables aren't hashable; key them by their Tcl name
+            self._pending_status[str(variable)] = (variable, message)
+        if schedule:
+            self.root.after(self.PROGRESS_UPDATE_MS, self._flush_status)
+
+    def _discard_status(self, variable):
+        """Drop a queued progress message so it can't overwrite a final status."""
+        with self._status_lock:
+            self._pending_status.pop(str(variable), None)
+
+    def _flush_status(self):
+        """Show the latest queued progress messages."""
+        with self._status_lock:
+            pending, self._pending_status = self._pending_status, {}
+        for variable, message in pending.values():
+            variable.set(message)
+
     def update_results(self):
         """Update GUI with version check results using modern styling."""
         try:
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            # Add results to tree with improved styling
+            # Classify every tool in one pass and count as we go, so each
+            # tool's installability is looked up once
+            missing_versions = self._MISSING_VERSIONS
+            is_installable = self.version_checker.is_tool_installable
+            total_tools = installed_count = installable_count = 0
+            rows = []
             for category, tools in self.results.items():
-                # Add category as parent node with icon
-                category_icon = self.get_category_icon(category)
-                category_id = self.tree.insert('', 'end', text=f"{category_icon} {category}", values=('', ''), open=True)
-
-                # Add tools under category
+                category_rows = []
                 for tool_name, version in tools.items():
                     # Determine action based on installation status and installability
-                    action_text = ""
-                    tags = ()
-
-                    if version in ['Not installed', 'Not found', 'Timeout (5s)', 'Error']:
-                        if self.version_checker.is_tool_installable(tool_name):
-                            action_text = "📦 Install"
-                            tags = ('installable',)
+                    if version in missing_versions:
+                        if is_installable(tool_name):
+                            action = self.ACTION_INSTALL
+                            installable_count += 1
                         else:
-                            action_text = "⚠️ Manual"
-                            tags = ('not_installed',)
+                            action = self.ACTION_MANUAL
                     else:
-                        action_text = "✅ Installed | 🗑️ Uninstall"
-                        tags = ('installed', 'uninstall')
-
-                    self.tree.insert(category_id, 'end',
-                                   text=f"  {tool_name}",
-                                   values=(version, action_text),
-                                   tags=tags)
+                        action = self.ACTION_UNINSTALL
+                        installed_count += 1
+                    category_rows.append((tool_name, version, action))
+                total_tools += len(category_rows)
+                rows.append((category, category_rows))
+
+            # Take the tree out of the layout while it is rebuilt so Tk
+            # does not re-layout after every insert
+            tree = self.tree
+            tree.grid_remove()
+            try:
+                self._clear_tree()
+
+                # Add results to tree with improved styling
+                for category, category_rows in rows:
+                    # Add category as parent node with icon; it starts collapsed
+                    # and its tools are inserted by _on_category_open
+                    category_icon = self.get_category_icon(category)
+                    category_id = tree.insert('', 'end', text=f"{category_icon} {category}", values=('', ''), open=False)
+                    if category_rows:
+                        # Placeholder child so the expand indicator is shown
+                        tree.insert(category_id, 'end', text='', values=('', ''))
+                        self._pending_children[category_id] = category_rows
+            finally:
+                tree.grid()
 
             # Configure tags with modern styling
             self.tree.tag_configure('not_installed', foreground=self.colors["warning"])
@@ -5386,16 +5908,6 @@ Disabling Hyper-V will:
             self.tree.tag_configure('uninstall', foreground=self.colors["warning"])
 
             # Update status with more detailed information
-            total_tools = sum(len(tools) for tools in self.results.values())
-            installed_count = sum(1 for tools in self.results.values()
-                                for version in tools.values()
-                                if version not in ['Not installed', 'Not found', 'Timeout (5s)', 'Error'])
-
-            installable_count = sum(1 for tools in self.results.values()
-                                  for tool_name, version in tools.items()
-                                  if version in ['Not installed', 'Not found', 'Timeout (5s)', 'Error']
-                                  and self.version_checker.is_tool_installable(tool_name))
-
             self.status_var.set(f"✅ Scan complete - {installed_count}/{total_tools} tools found, {installable_count} can be auto-installed")
 
             # Note: Export functionality is now handled by dropdown in other dialogs
@@ -5403,12 +5915,32 @@ Disabling Hyper-V will:
         except Exception as e:
             self.show_error(f"Error updating results: {str(e)}")
         finally:
+            self._cancel_check_timeout()
             self.progress.stop()
             self.refresh_btn.config(state='normal')
             # Enable export buttons after version check
             if hasattr(self, 'export_combo'):
                 self.export_combo.config(state='readonly')
 
+    def _on_category_open(self, event):
+        """Insert a category's tool rows the first time it is expanded."""
+        category_id = self.tree.focus()
+        category_rows = self._pending_children.pop(category_id, None)
+        if category_rows is None:
+            return
+
+        # Replace the placeholder with the real tool rows, remembering each
+        # row's details so selection handlers need not read them back from Tk
+        self.tree.delete(*self.tree.get_children(category_id))
+        action_display = self._ACTION_DISPLAY
+        for tool_name, version, action in category_rows:
+            action_text, tags = action_display[action]
+            item = self.tree.insert(category_id, 'end',
+                                    text=f"  {tool_name}",
+                                    values=(version, action_text),
+                                    tags=tags)
+            self._row_meta[item] = (tool_name, action)
+
     def on_export_selected(self, event):
         """Handle export dropdown selection."""
         selection = self.export_var.get()
@@ -5469,23 +6001,13 @@ Disabling Hyper-V will:
             return
             
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                imported_data = json.load(f)
-                
+            with open(filename, 'rb') as f:
+                tools_to_install = self._read_installable_tools(f)
+
             # Validate the imported data structure
-            if not isinstance(imported_data, dict):
+            if tools_to_install is None:
                 messagebox.showerror("Import Failed", "Invalid JSON format. Expected a dictionary.")
                 return
-                
-            # Find tools to install
-            tools_to_install = []
-            for category, tools in imported_data.items():
-                if not isinstance(tools, dict):
-                    continue
-                    
-                for tool_name, version in tools.items():
-                    if self.version_checker.is_tool_installable(tool_name):
-                        tools_to_install.append((tool_name, version))
             
             if not tools_to_install:
                 messagebox.showinfo("No Tools", "No installable tools found in the imported file.")
@@ -5494,10 +6016,39 @@ Disabling Hyper-V will:
             # Ask user which tools to install
             self.show_import_selection_dialog(tools_to_install)
                 
-        except json.JSONDecodeError:
+        except _JSON_ERRORS:
             messagebox.showerror("Import Failed", "Invalid JSON format.")
         except Exception as e:
             messagebox.showerror("Import Failed", f"Error importing file: {str(e)}")
+
+    def _read_installable_tools(self, f):
+        """Collect (tool_name, version) pairs for installable tools from a version JSON file.
+
+        Args:
+            f: Binary file holding a {category: {tool_name: version}} object
+
+        Returns:
+            List of (tool_name, version) tuples, or None if the top level is not an object
+        """
+        if ijson is not None:
+            # Stream the file one category at a time instead of loading it whole
+            events = ijson.parse(f)
+            first_event = next(events, None)
+            if first_event is None or first_event[1] != 'start_map':
+                return None
+            categories = ijson.kvitems(itertools.chain((first_event,), events), '')
+        else:
+            imported_data = json.load(f)
+            if not isinstance(imported_data, dict):
+                return None
+            categories = imported_data.items()
+
+        is_installable = self.version_checker.is_tool_installable
+        return [
+            (tool_name, version)
+            for _, tools in categories if isinstance(tools, dict)
+            for tool_name, version in tools.items() if is_installable(tool_name)
+        ]
             
     def show_import_selection_dialog(self, tools_to_install):
         """Show dialog to select which tools to install from imported JSON."""
@@ -5534,14 +6085,15 @@ Disabling Hyper-V will:
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=import_list.yview)
         import_list.configure(yscrollcommand=scrollbar.set)
         
+        # Add the tools to the listbox before it is packed, so it is laid
+        # out once with all rows rather than after each insert
+        for tool_name, version in tools_to_install:
+            import_list.insert("", tk.END, text=tool_name, values=(version))
+        
         # Pack the listbox and scrollbar
         import_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Add the tools to the listbox
-        for tool_name, version in tools_to_install:
-            import_list.insert("", tk.END, text=tool_name, values=(version))
-        
         # Add buttons
         button_frame = ttk.Frame(dialog)
         button_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
@@ -5549,7 +6101,7 @@ Disabling Hyper-V will:
         ttk.Button(
             button_frame,
             text="Install Selected",
-            command=lambda: self.install_selected_from_import(import_list, dialog),
+            command=functools.partial(self.install_selected_from_import, import_list, dialog),
             style="Primary.TButton"
         ).pack(side=tk.RIGHT, padx=5)
         
@@ -5581,8 +6133,15 @@ Disabling Hyper-V will:
         for tool_name, version in tools_to_install:
             self.install_tool(tool_name, version)
     
+    def _cancel_check_timeout(self):
+        """Cancel the pending version check timeout, if any."""
+        if self._check_timeout_id is not None:
+            self.root.after_cancel(self._check_timeout_id)
+            self._check_timeout_id = None
+
     def check_timeout(self):
         """Handle timeout if version checking takes too long."""
+        self._check_timeout_id = None
         if self.refresh_btn['state'] == 'disabled':  # Still checking
             self.progress.stop()
             self.refresh_btn.config(state='normal')
@@ -5591,85 +6150,70 @@ Disabling Hyper-V will:
 
     def on_tree_select(self, event):
         """Handle tree selection changes."""
-        item = self.tree.selection()[0] if self.tree.selection() else None
+        selection = self.tree.selection()
+        item = selection[0] if selection else None
         if not item:
             self.install_selected_btn.config(state='disabled')
             return
 
-        # Get item details
-        item_text = self.tree.item(item, 'text').strip()
-        item_values = self.tree.item(item, 'values')
-
         # Enable install button only for installable tools
-        if (item_text.startswith('  ') and len(item_values) >= 2 and
-            "📦 Install" in item_values[1]):
+        meta = self._row_meta.get(item)
+        if meta is not None and meta[1] == self.ACTION_INSTALL:
             self.install_selected_btn.config(state='normal')
         else:
             self.install_selected_btn.config(state='disabled')
 
     def on_tree_double_click(self, event):
         """Handle double-click on tree items for installation or uninstallation."""
-        item = self.tree.selection()[0] if self.tree.selection() else None
+        selection = self.tree.selection()
+        item = selection[0] if selection else None
         if not item:
             return
 
-        # Get item details
-        item_text = self.tree.item(item, 'text').strip()
-        item_values = self.tree.item(item, 'values')
-
-        # Debug print
-        print(f"DEBUG: Double-clicked item: '{item_text}', values: {item_values}")
-
         # Skip if it's not a valid tool item
-        if len(item_values) < 2:
-            print(f"DEBUG: Skipping - not a tool item")
+        meta = self._row_meta.get(item)
+        if meta is None:
+            log.debug("Skipping - not a tool item")
             return
 
-        # Remove leading spaces from tool name
-        tool_name = item_text.strip()
-        action = item_values[1] if len(item_values) > 1 else ""
+        tool_name, action = meta
 
-        print(f"DEBUG: Tool name: '{tool_name}', Action: '{action}'")
+        log.debug("Tool name: '%s', Action: '%s'", tool_name, self._ACTION_DISPLAY[action][0])
 
         # Check if it's an installed tool (for uninstall) or installable tool
-        if "📦 Install" in action:
-            print(f"DEBUG: Starting installation for {tool_name}")
+        if action == self.ACTION_INSTALL:
+            log.debug("Starting installation for %s", tool_name)
             self.install_tool(tool_name)
-        elif "✅ Installed | 🗑️ Uninstall" in action:
+        elif action == self.ACTION_UNINSTALL:
             # Show a confirmation dialog for uninstallation
             if messagebox.askyesno("Confirm Uninstall", f"Are you sure you want to uninstall {tool_name}?"):
-                print(f"DEBUG: Starting uninstallation for {tool_name}")
+                log.debug("Starting uninstallation for %s", tool_name)
                 self.uninstall_tool(tool_name)
         else:
-            print(f"DEBUG: Tool not installable or already installed")
+            log.debug("Tool not installable or already installed")
 
     def install_selected_tool(self):
         """Install the currently selected tool."""
-        item = self.tree.selection()[0] if self.tree.selection() else None
+        selection = self.tree.selection()
+        item = selection[0] if selection else None
         if not item:
             messagebox.showwarning("No Selection", "Please select a tool to install.")
             return
 
-        # Get item details
-        item_text = self.tree.item(item, 'text').strip()
-        item_values = self.tree.item(item, 'values')
-
-        if len(item_values) < 2:
+        meta = self._row_meta.get(item)
+        if meta is None:
             messagebox.showwarning("Invalid Selection", "Please select an installable tool.")
             return
 
-        tool_name = item_text.strip()
-        action = item_values[1] if len(item_values) > 1 else ""
+        tool_name, action = meta
         
     def uninstall_tool(self, tool_name):
         """Uninstall a tool using the version checker."""
-        # Check if the tool is already being installed
-        if tool_name in self.installing_tools:
+        # Check if the tool is already being installed, and add it to the
+        # installing set to prevent multiple operations
+        if not self._claim_tool(tool_name):
             messagebox.showwarning("Tool Busy", f"{tool_name} is currently being installed. Please wait for the installation to complete.")
             return
-            
-        # Add to installing set to prevent multiple operations
-        self.installing_tools.add(tool_name)
         
         # Update status
         self.status_var.set(f"Uninstalling {tool_name}...")
@@ -5736,20 +6280,33 @@ Disabling Hyper-V will:
         dialog.destroy()
         self.install_tool(tool_name, version if version.strip() else None)
 
+    def _claim_tool(self, tool_name):
+        """Mark a tool as being installed; return False if it already is."""
+        with self._installing_lock:
+            if tool_name in self.installing_tools:
+                return False
+            self.installing_tools.add(tool_name)
+            return True
+
+    def _release_tool(self, tool_name):
+        """Clear a tool's being-installed mark."""
+        with self._installing_lock:
+            self.installing_tools.discard(tool_name)
+
     def install_tool(self, tool_name, specific_version=None):
         """Install a specific tool with optional version."""
-        print(f"DEBUG: install_tool called with: '{tool_name}', version: '{specific_version}'")
+        log.debug("install_tool called with: '%s', version: '%s'", tool_name, specific_version)
 
         if tool_name in self.installing_tools:
-            print(f"DEBUG: Tool {tool_name} already being installed")
+            log.debug("Tool %s already being installed", tool_name)
             messagebox.showwarning("Installation in Progress", f"{tool_name} is already being installed.")
             return
 
         installable = self.version_checker.is_tool_installable(tool_name)
-        print(f"DEBUG: Tool {tool_name} installable: {installable}")
+        log.debug("Tool %s installable: %s", tool_name, installable)
 
         if not installable:
-            print(f"DEBUG: Tool {tool_name} not in installable list")
+            log.debug("Tool %s not in installable list", tool_name)
             messagebox.showwarning("Not Installable", f"{tool_name} cannot be automatically installed.")
             return
 
@@ -5758,18 +6315,18 @@ Disabling Hyper-V will:
         version_text = f" (version {specific_version})" if specific_version else ""
         response = messagebox.askyesno(
             "Confirm Installation",
-            f"Do you want to install {tool_name}{version_text}?\n\n"
-            f"Description: {description}\n\n"
-            f"This will use available package managers (winget, chocolatey, or npm) "
-            f"and may require administrator privileges.\n\n"
-            f"Continue with installation?"
+            self._INSTALL_PROMPT_TEMPLATE.format(
+                tool_name=tool_name, version_text=version_text, description=description)
         )
 
         if not response:
             return
 
-        # Start installation in background thread
-        self.installing_tools.add(tool_name)
+        # Start installation in background thread; an auto-install may have
+        # picked the tool up while the confirmation was open
+        if not self._claim_tool(tool_name):
+            messagebox.showwarning("Installation in Progress", f"{tool_name} is already being installed.")
+            return
         self.status_var.set(f"Installing {tool_name}...")
         self.progress.start()
 
@@ -5781,56 +6338,72 @@ Disabling Hyper-V will:
         """Background thread for tool installation."""
         try:
             def progress_callback(message):
-                self.root.after(0, lambda: self.status_var.set(f"Installing {tool_name}: {message}"))
+                self._post_status(self.status_var, f"Installing {tool_name}: {message}")
 
             success, message = self.version_checker.install_tool(tool_name, progress_callback, specific_version)
 
             # Schedule GUI update in main thread
+            self._discard_status(self.status_var)
             self.root.after(0, lambda: self.installation_complete(tool_name, success, message))
 
         except Exception as e:
-            self.root.after(0, lambda: self.installation_complete(tool_name, False, f"Installation error: {str(e)}"))
+            self._discard_status(self.status_var)
+            error = str(e)
+            self.root.after(0, lambda: self.installation_complete(tool_name, False, f"Installation error: {error}"))
             
     def uninstall_tool_thread(self, tool_name):
         """Background thread for tool uninstallation."""
         try:
             def progress_callback(message):
-                self.root.after(0, lambda: self.status_var.set(f"Uninstalling {tool_name}: {message}"))
+                self._post_status(self.status_var, f"Uninstalling {tool_name}: {message}")
 
             success, message = self.version_checker.uninstall_tool(tool_name, progress_callback)
 
             # Schedule GUI update in main thread
+            self._discard_status(self.status_var)
             self.root.after(0, lambda: self.uninstallation_complete(tool_name, success, message))
 
         except Exception as e:
-            self.root.after(0, lambda: self.uninstallation_complete(tool_name, False, f"Uninstallation error: {str(e)}"))
+            self._discard_status(self.status_var)
+            error = str(e)
+            self.root.after(0, lambda: self.uninstallation_complete(tool_name, False, f"Uninstallation error: {error}"))
             
     def auto_install_from_backup(self):
         """Install all tools that are installed in backup.json file."""
         backup_file = "backup.json"
         
         # Check if backup.json exists
-        if not os.path.exists(backup_file):
+        try:
+            backup_stat = os.stat(backup_file)
+        except FileNotFoundError:
             messagebox.showerror("File Not Found", f"Could not find {backup_file} in the current directory.")
             return
             
         try:
-            # Load backup.json
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                backup_data = json.load(f)
-                
-            # Find tools that are installed in backup.json
-            tools_to_install = []
-            for category, tools in backup_data.items():
-                if not isinstance(tools, dict):
-                    continue
+            # Reuse the last result while backup.json is unchanged
+            backup_key = (backup_stat.st_mtime_ns, backup_stat.st_size)
+            if self._backup_cache is not None and self._backup_cache[0] == backup_key:
+                tools_to_install = list(self._backup_cache[1])
+            else:
+                # Load backup.json
+                with open(backup_file, 'r', encoding='utf-8') as f:
+                    backup_data = json.load(f)
                     
-                for tool_name, version in tools.items():
-                    # Only include tools that are installed in backup.json
-                    if version not in ['Not installed', 'Not found', 'Timeout (5s)', 'Error', "'java' is not recognized as an internal or external command,", "'vue' is not recognized as an internal or external command,", "'svn' is not recognized as an internal or external command,"]:
-                        # Check if tool is installable
-                        if self.version_checker.is_tool_installable(tool_name):
-                            tools_to_install.append((tool_name, None))  # None for default version
+                # Find tools that are installed in backup.json
+                tools_to_install = []
+                missing_versions = self._BACKUP_MISSING_VERSIONS
+                for category, tools in backup_data.items():
+                    if not isinstance(tools, dict):
+                        continue
+                        
+                    for tool_name, version in tools.items():
+                        # Only include tools that are installed in backup.json
+                        if version not in missing_versions:
+                            # Check if tool is installable
+                            if self.version_checker.is_tool_installable(tool_name):
+                                tools_to_install.append((tool_name, None))  # None for default version
+
+                self._backup_cache = (backup_key, tuple(tools_to_install))
             
             if not tools_to_install:
                 messagebox.showinfo("No Tools", "No installable tools found in the backup file.")
@@ -5861,54 +6434,80 @@ Disabling Hyper-V will:
             
     def auto_install_thread(self, tools_to_install):
         """Background thread for auto-installing multiple tools."""
+        from concurrent.futures import ThreadPoolExecutor
+
         total_tools = len(tools_to_install)
-        successful_installs = 0
-        failed_installs = 0
+
+        # winget and chocolatey installers contend for the Windows Installer
+        # and chocolatey locks, and npm for its global prefix, so tools are
+        # installed one at a time per package manager family while the
+        # families run side by side
+        lanes = defaultdict(list)
+        installable_tools = self.version_checker.installable_tools
+        for index, (tool_name, version) in enumerate(tools_to_install, start=1):
+            lane = 'npm' if 'npm' in installable_tools.get(tool_name, {}) else 'system'
+            lanes[lane].append((index, tool_name, version))
+
+        installed_tools = []
+        failed_details = []
+        with ThreadPoolExecutor(max_workers=max(len(lanes), 1)) as executor:
+            futures = [executor.submit(self._auto_install_lane, lane_tools, total_tools)
+                       for lane_tools in lanes.values()]
+            for future in futures:
+                installed, details = future.result()
+                installed_tools.extend(installed)
+                failed_details.extend(details)
+        
+        # Update UI when all installations are complete; results are reported
+        # once in the summary instead of a popup per tool
+        self._discard_status(self.status_var)
+        self.root.after(0, lambda: self.auto_install_complete(len(installed_tools), len(failed_details), total_tools,
+                                                              failed_details, installed_tools))
+
+    def _auto_install_lane(self, lane_tools, total_tools):
+        """Install (index, tool_name, version) entries one after another.
+
+        Returns:
+            Tuple of (installed tool names, failure detail strings)
+        """
+        installed_tools = []
         failed_details = []
         
-        for i, (tool_name, version) in enumerate(tools_to_install):
-            # Skip if already being installed
-            if tool_name in self.installing_tools:
+        for index, tool_name, version in lane_tools:
+            # Skip if already being installed, otherwise add to installing set
+            if not self._claim_tool(tool_name):
                 continue
-                
-            # Add to installing set
-            self.installing_tools.add(tool_name)
             
             try:
                 # Update status
-                self.root.after(0, lambda: self.status_var.set(f"Installing {tool_name} ({i+1}/{total_tools})..."))
+                self._post_status(self.status_var, f"Installing {tool_name} ({index}/{total_tools})...")
                 
-                def progress_callback(message):
+                def progress_callback(message, index=index):
                     # Update status in main thread
-                    self.root.after(0, lambda: self.status_var.set(f"[{i+1}/{total_tools}] {message}"))
+                    self._post_status(self.status_var, f"[{index}/{total_tools}] {message}")
                 
                 # Install the tool
                 success, message = self.version_checker.install_tool(tool_name, progress_callback, version)
                 
                 if success:
-                    successful_installs += 1
-                    # Show success message
-                    self.root.after(0, lambda tool=tool_name: messagebox.showinfo("Installation Success", f"{tool} was installed successfully."))
+                    installed_tools.append(tool_name)
+                    self._post_status(self.status_var, f"[{index}/{total_tools}] {tool_name} was installed successfully")
                 else:
-                    failed_installs += 1
                     failed_details.append(f"{tool_name}: {message}")
-                    # Show failure message and continue
-                    self.root.after(0, lambda tool=tool_name, msg=message: messagebox.showerror("Installation Failed", f"Failed to install {tool}\nReason: {msg}"))
+                    # Note the failure and continue
+                    self._post_status(self.status_var, f"[{index}/{total_tools}] Failed to install {tool_name}")
                     
             except Exception as e:
-                failed_installs += 1
-                error_msg = str(e)
-                failed_details.append(f"{tool_name}: {error_msg}")
-                # Show error message and continue
-                self.root.after(0, lambda tool=tool_name, err=error_msg: messagebox.showerror("Installation Error", f"Error installing {tool}\nReason: {err}"))
+                failed_details.append(f"{tool_name}: {str(e)}")
+                # Note the error and continue
+                self._post_status(self.status_var, f"[{index}/{total_tools}] Error installing {tool_name}")
             finally:
                 # Remove from installing set
-                self.installing_tools.discard(tool_name)
-        
-        # Update UI when all installations are complete
-        self.root.after(0, lambda: self.auto_install_complete(successful_installs, failed_installs, total_tools, failed_details))
+                self._release_tool(tool_name)
+
+        return installed_tools, failed_details
     
-    def auto_install_complete(self, successful, failed, total, failed_details=None):
+    def auto_install_complete(self, successful, failed, total, failed_details=None, installed_tools=None):
         """Handle completion of auto-installation process."""
         self.progress.stop()
         
@@ -5920,9 +6519,15 @@ Disabling Hyper-V will:
         # Update status
         self.status_var.set(f"Auto-installation complete: {successful} successful, {failed} failed out of {total} tools")
         
+        # List the tools that were installed
+        if installed_tools:
+            installed = "\n\nInstalled:\n" + "\n".join(f"- {tool}" for tool in installed_tools)
+        else:
+            installed = ""
+
         # Show completion message
         if failed == 0:
-            messagebox.showinfo("Installation Complete", f"Successfully installed all {successful} tools.")
+            messagebox.showinfo("Installation Complete", f"Successfully installed all {successful} tools.{installed}")
         else:
             # Format the failure details
             if failed_details:
@@ -5931,7 +6536,7 @@ Disabling Hyper-V will:
                 details = ""
                 
             messagebox.showwarning("Installation Partially Complete", 
-                                 f"Installed {successful} tools successfully, but {failed} tools failed to install.{details}")
+                                 f"Installed {successful} tools successfully, but {failed} tools failed to install.{installed}{details}")
         
         # Refresh the tool list
         self.start_version_check()
@@ -5939,7 +6544,7 @@ Disabling Hyper-V will:
     def installation_complete(self, tool_name, success, message):
         """Handle completion of tool installation."""
         try:
-            self.installing_tools.discard(tool_name)
+            self._release_tool(tool_name)
             self.progress.stop()
 
             if success:
@@ -5958,7 +6563,7 @@ Disabling Hyper-V will:
     def uninstallation_complete(self, tool_name, success, message):
         """Handle completion of tool uninstallation."""
         # Remove from installing set
-        self.installing_tools.discard(tool_name)
+        self._release_tool(tool_name)
         self.progress.stop()
         
         # Re-enable buttons
@@ -5974,10 +6579,11 @@ Disabling Hyper-V will:
         else:
             self.status_var.set(f"Failed to uninstall {tool_name}")
             messagebox.showerror("Uninstallation Failed", f"Failed to uninstall {tool_name}: {message}")
-            print(f"DEBUG: Uninstallation failed: {message}")
+            log.debug("Uninstallation failed: %s", message)
 
     def show_error(self, message):
         """Show error message with improved styling."""
+        self._cancel_check_timeout()
         messagebox.showerror("Error", message)
         self.status_var.set("⚠️ Error occurred during version check")
         self.progress.stop()
@@ -5985,17 +6591,7 @@ Disabling Hyper-V will:
         
     def get_category_icon(self, category):
         """Return an appropriate icon for each category."""
-        icons = {
-            "Languages": "🔤",
-            "Package Managers": "📦",
-            "Frontend Tools": "🖥️",
-            "Version Control": "🔄",
-            "Databases": "💾",
-            "Development Tools": "🔧",
-            "Development Environments": "🏗️",
-            "Cloud Tools": "☁️"
-        }
-        return icons.get(category, "🔹")
+        return self._CATEGORY_ICONS.get(category, "🔹")
 
     def on_close(self):
         """Handle window close event."""
@@ -6003,6 +6599,7 @@ Disabling Hyper-V will:
         if self.installing_tools:
             if messagebox.askyesno("Confirm Exit", "Installation(s) in progress. Are you sure you want to exit?"):
                 # Force exit the application
+                self._close_scm_handle()
                 self.root.destroy()
                 sys.exit(0)
             else:
@@ -6010,6 +6607,7 @@ Disabling Hyper-V will:
                 return
         else:
             # No installations in progress, just exit
+            self._close_scm_handle()
             self.root.destroy()
             sys.exit(0)
     
@@ -6049,8 +6647,7 @@ Disabling Hyper-V will:
                 browser_frame,
                 text=f"🌐 {browser_name} ({status})",
                 variable=var,
-                state='normal' if is_detected else 'disabled',
-                style="TCheckbutton"
+                state='normal' if is_detected else 'disabled'
             )
             cb.pack(anchor=tk.W, pady=2)
 
@@ -6152,16 +6749,18 @@ Disabling Hyper-V will:
             backup_results = []
 
             for browser in browsers:
-                def progress_callback(message):
-                    self.root.after(0, lambda: self.backup_status.set(f"{browser}: {message}"))
+                def progress_callback(message, browser=browser):
+                    self._post_status(self.backup_status, f"{browser}: {message}")
 
                 success, result = self.browser_backup.backup_browser(browser, progress_callback=progress_callback)
                 backup_results.append((browser, success, result))
 
             # Schedule GUI update in main thread
+            self._discard_status(self.backup_status)
             self.root.after(0, lambda: self.backup_complete(backup_results, dialog))
 
         except Exception as e:
+            self._discard_status(self.backup_status)
             self.root.after(0, lambda: self.backup_error(str(e), dialog))
 
     def backup_complete(self, results, dialog):
@@ -6197,12 +6796,6 @@ Disabling Hyper-V will:
 
     def show_browser_restore_dialog(self):
         """Show browser restore dialog with working restore button."""
-        backups = self.browser_backup.list_backups()
-
-        if not backups:
-            messagebox.showinfo("No Backups", "No browser backups found. Please create a backup first.")
-            return
-
         dialog = tk.Toplevel(self.root)
         dialog.title("Restore Browser Data")
         dialog.geometry("800x700")  # Larger size for better visibility
@@ -6241,22 +6834,11 @@ Disabling Hyper-V will:
         )
         self.backup_listbox.pack(fill=tk.BOTH, expand=True, pady=10)
 
-        # Store backup data for easy access
+        # Store backup data for easy access; filled in by _populate_restore_list
         self.backup_data = []
 
-        # Populate backup list
-        for i, backup in enumerate(backups):
-            browser = backup.get('browser', 'Unknown')
-            date = backup.get('backup_date', backup.get('timestamp', 'Unknown'))
-            size = self.browser_backup.format_size(backup.get('size', 0))
-
-            # Create simple display text
-            display_text = f"🌐 {browser} - {date} ({size})"
-            self.backup_listbox.insert(tk.END, display_text)
-            self.backup_data.append(backup)
-
         # Selection info
-        self.selected_backup_info = tk.StringVar(value="👆 Please select a backup from the list above")
+        self.selected_backup_info = tk.StringVar(value="🔄 Loading backups...")
         selected_label = ttk.Label(
             backup_frame,
             textvariable=self.selected_backup_info,
@@ -6374,6 +6956,9 @@ Disabling Hyper-V will:
 
         self.backup_listbox.bind('<<ListboxSelect>>', on_backup_select)
 
+        # Listing backups walks every backup directory to size it; keep it off the Tk thread
+        threading.Thread(target=self._load_restore_backups_thread, args=(dialog,), daemon=True).start()
+
         # Force dialog to update and show buttons
         dialog.update_idletasks()
         print(f"Restore dialog created with geometry: {dialog.geometry()}")
@@ -6393,15 +6978,17 @@ Disabling Hyper-V will:
         """Background thread for browser restore."""
         try:
             def progress_callback(message):
-                self.root.after(0, lambda: self.restore_status.set(f"Restoring: {message}"))
+                self._post_status(self.restore_status, f"Restoring: {message}")
 
             success, message = self.browser_backup.restore_browser(
                 backup_path, target_browser, progress_callback
             )
 
+            self._discard_status(self.restore_status)
             self.root.after(0, lambda: self.restore_complete(success, message, dialog))
 
         except Exception as e:
+            self._discard_status(self.restore_status)
             self.root.after(0, lambda: self.restore_error(str(e), dialog))
 
     def restore_complete(self, success, message, dialog):
@@ -6427,43 +7014,68 @@ Disabling Hyper-V will:
         """Refresh the restore backup list."""
         # Clear existing items
         self.backup_listbox.delete(0, tk.END)
-        self.backup_data.clear()
+        self.backup_data = []
+        self.selected_backup_info.set("🔄 Loading backups...")
 
         # Reload backups
-        backups = self.browser_backup.list_backups()
+        threading.Thread(target=self._load_restore_backups_thread, args=(dialog,), daemon=True).start()
 
-        if not backups:
-            messagebox.showinfo("No Backups", "No browser backups found.")
-            dialog.destroy()
-            return
+    def _load_restore_backups_thread(self, dialog):
+        """Background thread for listing backups in the restore dialog."""
+        try:
+            backups = self.browser_backup.list_backups()
+            # Format the list entries here too, so the Tk thread only inserts them
+            items = [(self._format_restore_backup(backup), backup) for backup in backups]
+            error = None
+        except Exception as e:
+            items, error = [], str(e)
 
-        # Populate backup list with user-friendly format
-        for i, backup in enumerate(backups):
-            browser = backup.get('browser', 'Unknown')
-            date = backup.get('backup_date', backup.get('timestamp', 'Unknown'))
-            size = self.browser_backup.format_size(backup.get('size', 0))
-            profiles = backup.get('profiles', [])
+        self.root.after(0, lambda: self._populate_restore_list(dialog, items, error))
 
-            # Format date nicely
-            try:
-                from datetime import datetime
-                if 'T' in date:
-                    dt = datetime.fromisoformat(date.replace('Z', '+00:00'))
-                    formatted_date = dt.strftime("%B %d, %Y at %I:%M %p")
-                else:
-                    formatted_date = date
-            except:
+    def _format_restore_backup(self, backup):
+        """Return the restore list text for one backup."""
+        browser = backup.get('browser', 'Unknown')
+        date = backup.get('backup_date', backup.get('timestamp', 'Unknown'))
+        size = self.browser_backup.format_size(backup.get('size', 0))
+        profiles = backup.get('profiles', [])
+
+        # Format date nicely
+        try:
+            if 'T' in date:
+                dt = datetime.fromisoformat(date.replace('Z', '+00:00'))
+                formatted_date = dt.strftime("%B %d, %Y at %I:%M %p")
+            else:
                 formatted_date = date
+        except:
+            formatted_date = date
+
+        # Create user-friendly display text
+        display_text = f"🌐 {browser} - {formatted_date} ({size})"
+        if profiles:
+            display_text += f" - Profiles: {', '.join(profiles[:2])}"
+            if len(profiles) > 2:
+                display_text += f" +{len(profiles)-2} more"
+        return display_text
+
+    def _populate_restore_list(self, dialog, items, error):
+        """Fill the restore dialog with (display_text, backup) items."""
+        if not dialog.winfo_exists():
+            return
 
-            # Create user-friendly display text
-            display_text = f"🌐 {browser} - {formatted_date} ({size})"
-            if profiles:
-                display_text += f" - Profiles: {', '.join(profiles[:2])}"
-                if len(profiles) > 2:
-                    display_text += f" +{len(profiles)-2} more"
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to list backups: {error}")
+            self.selected_backup_info.set("Failed to load backups")
+            return
+
+        if not items:
+            messagebox.showinfo("No Backups", "No browser backups found. Please create a backup first.")
+            dialog.destroy()
+            return
 
-            self.backup_listbox.insert(tk.END, display_text)
-            self.backup_data.append(backup)
+        # Populate backup list with user-friendly format
+        self.backup_listbox.delete(0, tk.END)
+        self.backup_listbox.insert(tk.END, *(display_text for display_text, _ in items))
+        self.backup_data = [backup for _, backup in items]
 
         # Reset selection info
         self.selected_backup_info.set("👆 Please select a backup from the list above")
@@ -6641,8 +7253,7 @@ Disabling Hyper-V will:
                 browser_frame,
                 text=f"🌐 {browser}",
                 variable=browser_var,
-                value=browser,
-                style="TRadiobutton"
+                value=browser
             ).pack(anchor=tk.W, pady=2)
 
         # Profile selection
@@ -6771,8 +7382,7 @@ Disabling Hyper-V will:
             textvariable=self.hw_export_var,
             values=["📤 Export", "📄 JSON", "📝 Text"],
             state="disabled",
-            width=12,
-            style="TCombobox"
+            width=12
         )
         self.hw_export_combo.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -7278,8 +7888,7 @@ Disabling Hyper-V will:
             textvariable=self.startup_export_var,
             values=["📤 Export", "📄 JSON", "📝 Text"],
             state="disabled",
-            width=12,
-            style="TCombobox"
+            width=12
         )
         self.startup_export_combo.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -464,9 +464,8 @@ class VersionChecker:
 
     def get_install_description(self, tool_name: str) -> str:
         """Get description for installable tool."""
-        if tool_name in self.installable_tools:
-            return self.installable_tools[tool_name]['description']
-        return ""
+        tool_config = self.installable_tools.get(tool_name)
+        return tool_config['description'] if tool_config else ""
 
     def check_package_managers(self) -> Dict[str, bool]:
         """Check which package managers are available for installation."""
@@ -758,13 +757,28 @@ class VersionChecker:
         Returns:
             Dictionary organized by category with tool versions
         """
-        results = {}
+        import os
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        # Pre-create every category dict so results keep the configured order
+        # even though the checks finish in any order
+        results = {category: dict.fromkeys(tools) for category, tools in self.tools.items()}
         total_tools = sum(len(tools) for tools in self.tools.values())
         current_tool = 0
 
-        for category, tools in self.tools.items():
-            results[category] = {}
-            for tool_name, command in tools.items():
+        # Each check mostly waits on a subprocess, so run them side by side. Keep
+        # it to one per CPU: tools like java or dotnet start slowly, and too many
+        # at once push them past the 5 second timeout in _try_command
+        max_workers = min(os.cpu_count() or 1, max(total_tools, 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.check_single_version, command): (category, tool_name)
+                for category, tools in self.tools.items()
+                for tool_name, command in tools.items()
+            }
+
+            for future in as_completed(futures):
+                category, tool_name = futures[future]
                 current_tool += 1
 
                 # Report progress if callback provided
@@ -772,7 +786,7 @@ class VersionChecker:
                     progress_callback(current_tool, total_tools, tool_name)
 
                 try:
-                    success, version = self.check_single_version(command)
+                    success, version = future.result()
                     results[category][tool_name] = version
                 except Exception as e:
                     results[category][tool_name] = f"Error: {str(e)[:30]}"
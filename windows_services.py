@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Windows Services Module
+Native access to the Windows Service Control Manager (SCM) through ctypes,
+so service enumeration does not need to spawn sc.exe or PowerShell.
+"""
+
+import ctypes
+from ctypes import wintypes
+from contextlib import contextmanager
+import platform
+import time
+
+# Service Control Manager access rights
+SC_MANAGER_CONNECT = 0x0001
+SC_MANAGER_ENUMERATE_SERVICE = 0x0004
+
+# Service access rights
+SERVICE_CHANGE_CONFIG = 0x0002
+SERVICE_QUERY_STATUS = 0x0004
+SERVICE_ENUMERATE_DEPENDENTS = 0x0008
+SERVICE_START = 0x0010
+SERVICE_STOP = 0x0020
+
+SERVICE_CONTROL_STOP = 0x00000001
+SC_STATUS_PROCESS_INFO = 0
+
+# ChangeServiceConfig start types
+SERVICE_NO_CHANGE = 0xFFFFFFFF
+SERVICE_AUTO_START = 0x00000002
+SERVICE_DEMAND_START = 0x00000003
+SERVICE_DISABLED = 0x00000004
+
+SERVICE_STOPPED = 1
+
+ERROR_SERVICE_ALREADY_RUNNING = 1056
+ERROR_SERVICE_NOT_ACTIVE = 1062
+
+# EnumServicesStatusEx arguments
+SC_ENUM_PROCESS_INFO = 0
+SERVICE_WIN32_OWN_PROCESS = 0x00000010
+SERVICE_WIN32_SHARE_PROCESS = 0x00000020
+SERVICE_WIN32 = SERVICE_WIN32_OWN_PROCESS | SERVICE_WIN32_SHARE_PROCESS
+SERVICE_STATE_ALL = 0x00000003
+
+ERROR_MORE_DATA = 234
+
+# dwCurrentState values, formatted the same way as the sc.exe parser
+SERVICE_STATES = {
+    1: 'Stopped',
+    2: 'Start Pending',
+    3: 'Stop Pending',
+    4: 'Running',
+    5: 'Continue Pending',
+    6: 'Pause Pending',
+    7: 'Paused'
+}
+
+SERVICE_TYPES = {
+    SERVICE_WIN32_OWN_PROCESS: 'Own Process',
+    SERVICE_WIN32_SHARE_PROCESS: 'Share Process'
+}
+
+
+class SERVICE_STATUS(ctypes.Structure):
+    """Mirror of the Win32 SERVICE_STATUS structure."""
+
+    _fields_ = [
+        ('dwServiceType', wintypes.DWORD),
+        ('dwCurrentState', wintypes.DWORD),
+        ('dwControlsAccepted', wintypes.DWORD),
+        ('dwWin32ExitCode', wintypes.DWORD),
+        ('dwServiceSpecificExitCode', wintypes.DWORD),
+        ('dwCheckPoint', wintypes.DWORD),
+        ('dwWaitHint', wintypes.DWORD)
+    ]
+
+
+class ENUM_SERVICE_STATUSW(ctypes.Structure):
+    """Mirror of the Win32 ENUM_SERVICE_STATUSW structure."""
+
+    _fields_ = [
+        ('lpServiceName', wintypes.LPWSTR),
+        ('lpDisplayName', wintypes.LPWSTR),
+        ('ServiceStatus', SERVICE_STATUS)
+    ]
+
+
+class SERVICE_STATUS_PROCESS(ctypes.Structure):
+    """Mirror of the Win32 SERVICE_STATUS_PROCESS structure."""
+
+    _fields_ = [
+        ('dwServiceType', wintypes.DWORD),
+        ('dwCurrentState', wintypes.DWORD),
+        ('dwControlsAccepted', wintypes.DWORD),
+        ('dwWin32ExitCode', wintypes.DWORD),
+        ('dwServiceSpecificExitCode', wintypes.DWORD),
+        ('dwCheckPoint', wintypes.DWORD),
+        ('dwWaitHint', wintypes.DWORD),
+        ('dwProcessId', wintypes.DWORD),
+        ('dwServiceFlags', wintypes.DWORD)
+    ]
+
+
+class ENUM_SERVICE_STATUS_PROCESSW(ctypes.Structure):
+    """Mirror of the Win32 ENUM_SERVICE_STATUS_PROCESSW structure."""
+
+    _fields_ = [
+        ('lpServiceName', wintypes.LPWSTR),
+        ('lpDisplayName', wintypes.LPWSTR),
+        ('ServiceStatusProcess', SERVICE_STATUS_PROCESS)
+    ]
+
+
+_advapi32 = None
+
+
+def _get_advapi32():
+    """Load advapi32 on first use and declare the SCM function signatures."""
+    global _advapi32
+
+    if _advapi32 is None:
+        if platform.system().lower() != 'windows':
+            raise OSError("The Service Control Manager is only available on Windows")
+
+        advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+
+        advapi32.OpenSCManagerW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD]
+        advapi32.OpenSCManagerW.restype = wintypes.HANDLE
+
+        advapi32.CloseServiceHandle.argtypes = [wintypes.HANDLE]
+        advapi32.CloseServiceHandle.restype = wintypes.BOOL
+
+        advapi32.EnumServicesStatusExW.argtypes = [
+            wintypes.HANDLE, ctypes.c_int, wintypes.DWORD, wintypes.DWORD,
+            ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+            ctypes.POINTER(wintypes.DWORD), ctypes.POINTER(wintypes.DWORD),
+            wintypes.LPCWSTR
+        ]
+        advapi32.EnumServicesStatusExW.restype = wintypes.BOOL
+
+        advapi32.OpenServiceW.argtypes = [wintypes.HANDLE, wintypes.LPCWSTR, wintypes.DWORD]
+        advapi32.OpenServiceW.restype = wintypes.HANDLE
+
+        advapi32.StartServiceW.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.c_void_p]
+        advapi32.StartServiceW.restype = wintypes.BOOL
+
+        advapi32.ControlService.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(SERVICE_STATUS)]
+        advapi32.ControlService.restype = wintypes.BOOL
+
+        advapi32.QueryServiceStatusEx.argtypes = [
+            wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD,
+            ctypes.POINTER(wintypes.DWORD)
+        ]
+        advapi32.QueryServiceStatusEx.restype = wintypes.BOOL
+
+        advapi32.ChangeServiceConfigW.argtypes = [
+            wintypes.HANDLE, wintypes.DWORD, wintypes.DWORD, wintypes.DWORD,
+            wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.POINTER(wintypes.DWORD),
+            wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.LPCWSTR
+        ]
+        advapi32.ChangeServiceConfigW.restype = wintypes.BOOL
+
+        advapi32.EnumDependentServicesW.argtypes = [
+            wintypes.HANDLE, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD,
+            ctypes.POINTER(wintypes.DWORD), ctypes.POINTER(wintypes.DWORD)
+        ]
+        advapi32.EnumDependentServicesW.restype = wintypes.BOOL
+
+        _advapi32 = advapi32
+
+    return _advapi32
+
+
+def open_scm(access=SC_MANAGER_CONNECT | SC_MANAGER_ENUMERATE_SERVICE):
+    """Open a handle to the local Service Control Manager."""
+    handle = _get_advapi32().OpenSCManagerW(None, None, access)
+    if not handle:
+        raise ctypes.WinError(ctypes.get_last_error())
+    return handle
+
+
+def close_handle(handle):
+    """Close an SCM or service handle."""
+    if handle:
+        _get_advapi32().CloseServiceHandle(handle)
+
+
+def enum_services(scm_handle=None):
+    """Enumerate all Win32 services with a single EnumServicesStatusExW walk.
+
+    Args:
+        scm_handle: Optional open SCM handle. A temporary one is opened and
+            closed when omitted.
+
+    Returns:
+        List of dicts with name, display_name, status, service_type and
+        process_id keys.
+    """
+    advapi32 = _get_advapi32()
+    owns_handle = scm_handle is None
+    if owns_handle:
+        scm_handle = open_scm()
+
+    try:
+        services = []
+        bytes_needed = wintypes.DWORD(0)
+        services_returned = wintypes.DWORD(0)
+        resume_handle = wintypes.DWORD(0)
+        buffer = None
+        buffer_size = 0
+
+        while True:
+            ok = advapi32.EnumServicesStatusExW(
+                scm_handle, SC_ENUM_PROCESS_INFO, SERVICE_WIN32, SERVICE_STATE_ALL,
+                buffer, buffer_size,
+                ctypes.byref(bytes_needed), ctypes.byref(services_returned),
+                ctypes.byref(resume_handle), None
+            )
+            error = 0 if ok else ctypes.get_last_error()
+            if not ok and error != ERROR_MORE_DATA:
+                raise ctypes.WinError(error)
+
+            # Decode the structs in place - no text parsing involved
+            if services_returned.value:
+                entries = ctypes.cast(
+                    buffer, ctypes.POINTER(ENUM_SERVICE_STATUS_PROCESSW * services_returned.value)
+                ).contents
+                for entry in entries:
+                    status = entry.ServiceStatusProcess
+                    services.append({
+                        'name': entry.lpServiceName,
+                        'display_name': entry.lpDisplayName or entry.lpServiceName,
+                        'status': SERVICE_STATES.get(status.dwCurrentState, 'Unknown'),
+                        'service_type': SERVICE_TYPES.get(status.dwServiceType & SERVICE_WIN32, 'Unknown'),
+                        'process_id': status.dwProcessId
+                    })
+
+            if ok:
+                return services
+
+            # ERROR_MORE_DATA: size the buffer from the reported requirement
+            if bytes_needed.value > buffer_size:
+                buffer_size = bytes_needed.value
+                buffer = ctypes.create_string_buffer(buffer_size)
+    finally:
+        if owns_handle:
+            close_handle(scm_handle)
+
+
+@contextmanager
+def _open_service(service_name, access, scm_handle=None):
+    """Open a service handle, closing it (and any temporary SCM handle) on exit."""
+    advapi32 = _get_advapi32()
+    owns_scm = scm_handle is None
+    if owns_scm:
+        scm_handle = open_scm(SC_MANAGER_CONNECT)
+
+    try:
+        service_handle = advapi32.OpenServiceW(scm_handle, service_name, access)
+        if not service_handle:
+            raise ctypes.WinError(ctypes.get_last_error())
+        try:
+            yield service_handle
+        finally:
+            close_handle(service_handle)
+    finally:
+        if owns_scm:
+            close_handle(scm_handle)
+
+
+def _query_state(service_handle):
+    """Return the dwCurrentState of an open service handle."""
+    status = SERVICE_STATUS_PROCESS()
+    bytes_needed = wintypes.DWORD(0)
+    if not _get_advapi32().QueryServiceStatusEx(
+            service_handle, SC_STATUS_PROCESS_INFO, ctypes.byref(status),
+            ctypes.sizeof(status), ctypes.byref(bytes_needed)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return status.dwCurrentState
+
+
+def _wait_for_state(service_handle, state, timeout):
+    """Poll the service until it reaches state or timeout seconds pass."""
+    deadline = time.monotonic() + timeout
+    while _query_state(service_handle) != state:
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Service did not reach state {SERVICE_STATES.get(state, state)} in time")
+        time.sleep(0.1)
+
+
+def start_service(service_name, scm_handle=None, ignore_running=False):
+    """Start a service. Raises OSError if the SCM rejects the request.
+
+    Args:
+        service_name: Service to start
+        scm_handle: Optional open SCM handle to reuse
+        ignore_running: Treat an already running service as success
+    """
+    with _open_service(service_name, SERVICE_START, scm_handle) as service_handle:
+        if not _get_advapi32().StartServiceW(service_handle, 0, None):
+            error = ctypes.get_last_error()
+            if not (ignore_running and error == ERROR_SERVICE_ALREADY_RUNNING):
+                raise ctypes.WinError(error)
+
+
+def stop_service(service_name, scm_handle=None, ignore_not_active=False):
+    """Send a stop control to a service.
+
+    Args:
+        service_name: Service to stop
+        scm_handle: Optional open SCM handle to reuse
+        ignore_not_active: Treat an already stopped service as success
+    """
+    with _open_service(service_name, SERVICE_STOP, scm_handle) as service_handle:
+        status = SERVICE_STATUS()
+        if not _get_advapi32().ControlService(service_handle, SERVICE_CONTROL_STOP, ctypes.byref(status)):
+            error = ctypes.get_last_error()
+            if not (ignore_not_active and error == ERROR_SERVICE_NOT_ACTIVE):
+                raise ctypes.WinError(error)
+
+
+def restart_service(service_name, scm_handle=None, timeout=30):
+    """Stop a service, wait until it has actually stopped, then start it again."""
+    access = SERVICE_STOP | SERVICE_START | SERVICE_QUERY_STATUS
+    advapi32 = _get_advapi32()
+    with _open_service(service_name, access, scm_handle) as service_handle:
+        status = SERVICE_STATUS()
+        if not advapi32.ControlService(service_handle, SERVICE_CONTROL_STOP, ctypes.byref(status)):
+            error = ctypes.get_last_error()
+            if error != ERROR_SERVICE_NOT_ACTIVE:
+                raise ctypes.WinError(error)
+
+        # Poll for SERVICE_STOPPED instead of sleeping a fixed interval
+        _wait_for_state(service_handle, SERVICE_STOPPED, timeout)
+
+        if not advapi32.StartServiceW(service_handle, 0, None):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+
+def set_start_type(service_name, start_type, scm_handle=None):
+    """Change a service's start type (SERVICE_AUTO_START, SERVICE_DISABLED, ...)."""
+    with _open_service(service_name, SERVICE_CHANGE_CONFIG, scm_handle) as service_handle:
+        if not _get_advapi32().ChangeServiceConfigW(
+                service_handle, SERVICE_NO_CHANGE, start_type, SERVICE_NO_CHANGE,
+                None, None, None, None, None, None, None):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+
+def enum_dependent_services(service_name, scm_handle=None):
+    """Return the names of services that depend on service_name."""
+    advapi32 = _get_advapi32()
+    with _open_service(service_name, SERVICE_ENUMERATE_DEPENDENTS, scm_handle) as service_handle:
+        bytes_needed = wintypes.DWORD(0)
+        services_returned = wintypes.DWORD(0)
+
+        # The first call only reports the buffer size (or succeeds with no dependents)
+        if advapi32.EnumDependentServicesW(
+                service_handle, SERVICE_STATE_ALL, None, 0,
+                ctypes.byref(bytes_needed), ctypes.byref(services_returned)):
+            return []
+        error = ctypes.get_last_error()
+        if error != ERROR_MORE_DATA:
+            raise ctypes.WinError(error)
+
+        buffer = ctypes.create_string_buffer(bytes_needed.value)
+        if not advapi32.EnumDependentServicesW(
+                service_handle, SERVICE_STATE_ALL, buffer, bytes_needed.value,
+                ctypes.byref(bytes_needed), ctypes.byref(services_returned)):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+        entries = ctypes.cast(
+            buffer, ctypes.POINTER(ENUM_SERVICE_STATUSW * services_returned.value)
+        ).contents
+        return [entry.lpServiceName for entry in entries]